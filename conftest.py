@@ -4,11 +4,12 @@ Pytest configuration for comprehensive test suite.
 Configures test discovery, coverage reporting, and test execution.
 """
 import pytest
+import socket
 import sys
-import os
+from pathlib import Path
 
-# Ensure src is in path for all tests
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+# Ensure src is in path for all tests (test modules rely on this)
+sys.path.insert(0, str(Path(__file__).resolve().parent / "src"))
 
 
 def pytest_configure(config):
@@ -22,6 +23,112 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "api: marks tests that require API access"
     )
+    config.addinivalue_line(
+        "markers", "realnet: allows a test to open real network connections"
+    )
+
+
+_real_connect = socket.socket.connect
+_real_getaddrinfo = socket.getaddrinfo
+_LOCAL_HOSTS = {None, "localhost", "127.0.0.1", "::1"}
+
+
+@pytest.fixture(autouse=True)
+def block_network(request, monkeypatch):
+    """Fail fast on outbound connections so an unmocked HF/GitHub/GenAI call
+    cannot slow a test down; opt out with @pytest.mark.realnet."""
+    if "realnet" in request.keywords:
+        return
+
+    def guarded_getaddrinfo(host, *args, **kwargs):
+        if host in _LOCAL_HOSTS:
+            return _real_getaddrinfo(host, *args, **kwargs)
+        raise OSError(f"network access disabled in tests: {host!r}")
+
+    def guarded_connect(sock, address):
+        if sock.family == getattr(socket, "AF_UNIX", None) or (
+                isinstance(address, tuple) and address[0] in _LOCAL_HOSTS):
+            return _real_connect(sock, address)
+        raise OSError(f"network access disabled in tests: {address!r}")
+
+    monkeypatch.setattr(socket, "getaddrinfo", guarded_getaddrinfo)
+    monkeypatch.setattr(socket.socket, "connect", guarded_connect)
+
+
+@pytest.fixture(autouse=True)
+def clear_fetch_caches():
+    """Drop memoized HF/GitHub/GenAI payloads so one test's mocks never
+    leak into the next."""
+    yield
+    from src.metrics.data_fetcher import huggingface, github, llm
+    huggingface.get_huggingface_model_data.cache_clear()
+    github.get_github_repo_data.cache_clear()
+    llm.get_genai_metric_data.cache_clear()
+
+
+class _StubResponse:
+    """Minimal stand-in for requests.Response."""
+
+    def __init__(self, url, status=200, json=None):
+        self.url = url
+        self.status_code = status
+        self.ok = status < 400
+        self._json = json
+
+    def json(self):
+        return self._json
+
+    def raise_for_status(self):
+        if not self.ok:
+            import requests
+            raise requests.HTTPError(f"{self.status_code} for {self.url}")
+
+
+class _HttpRegistry:
+    """Canned responses for requests.get/requests.head, keyed by URL."""
+
+    def __init__(self):
+        self._routes = {}
+        self.calls = []  # (method, url) in request order
+
+    def register(self, url, json=None, status=200, method="GET"):
+        self._routes[(method.upper(), url)] = _StubResponse(url, status, json)
+
+    def _dispatch(self, method):
+        def handler(url, *args, **kwargs):
+            self.calls.append((method, url))
+            try:
+                return self._routes[(method, url)]
+            except KeyError:
+                import requests
+                raise requests.ConnectionError(
+                    f"no stub registered for {method} {url}") from None
+        return handler
+
+
+@pytest.fixture
+def http_registry(monkeypatch):
+    """Route requests.get/head (module-level and Session) to registered
+    stubs; anything else raises."""
+    import requests
+
+    registry = _HttpRegistry()
+    get, head = registry._dispatch("GET"), registry._dispatch("HEAD")
+    monkeypatch.setattr(requests, "get", get)
+    monkeypatch.setattr(requests, "head", head)
+    monkeypatch.setattr(requests.Session, "get",
+                        lambda self, url, *a, **kw: get(url))
+    monkeypatch.setattr(requests.Session, "head",
+                        lambda self, url, *a, **kw: head(url))
+    return registry
+
+
+@pytest.fixture(scope="session")
+def bert_input_file(tmp_path_factory):
+    """URL input file for CLI tests, written once per session."""
+    path = tmp_path_factory.mktemp("cli_input") / "urls.txt"
+    path.write_text("https://huggingface.co/bert-base-uncased")
+    return str(path)
 
 
 def pytest_collection_modifyitems(config, items):
@@ -7,6 +7,9 @@ from src.url_parsers import handle_url, get_url_category
 from src.cli.schema import default_ndjson
 import logging
 
+# Classic and fine-grained GitHub personal access token prefixes
+_GITHUB_TOKEN_PREFIXES = ("ghp_", "github_pat_")
+
 
 def _check_env_variables() -> None:
     tok = os.getenv("GITHUB_TOKEN")
@@ -26,7 +29,7 @@ def _check_env_variables() -> None:
             sys.exit(1)
     if not tok:
         sys.exit(1)
-    looks_valid = tok.startswith("ghp_") or tok.startswith("github_pat_")
+    looks_valid = tok.startswith(_GITHUB_TOKEN_PREFIXES)
     if not looks_valid:
         sys.exit(1)
 
@@ -65,43 +68,48 @@ def evaluate_url(models: dict) -> Dict[str, Any]:
     #     return handle_url(models)
 
 
-def validate_ndjson(record: Dict[str, Any]) -> bool:
-    string_fields = {"name", "category"}
-    score_fields = {
-        "net_score",
-        "ramp_up_time",
-        "bus_factor",
-        "performance_claims",
-        "license",
-        "size_score",
-        "dataset_and_code_score",
-        "dataset_quality",
-        "code_quality"}
-    latency_fields = {
-        "net_score_latency",
-        "ramp_up_time_latency",
-        "bus_factor_latency",
-        "performance_claims_latency",
-        "license_latency",
-        "size_score_latency",
-        "dataset_and_code_score_latency",
-        "dataset_quality_latency",
-        "code_quality_latency"}
+# json.dumps only reuses its cached encoder for default options, so keep
+# one compact encoder around for the per-record output
+_encode_compact = json.JSONEncoder(separators=(",", ":")).encode
+
+
+# NDJSON record schema, built once at import
+_STRING_FIELDS = frozenset({"name", "category"})
+_SCORE_FIELDS = frozenset({
+    "net_score",
+    "ramp_up_time",
+    "bus_factor",
+    "performance_claims",
+    "license",
+    "size_score",
+    "dataset_and_code_score",
+    "dataset_quality",
+    "code_quality"})
+_LATENCY_FIELDS = frozenset({
+    "net_score_latency",
+    "ramp_up_time_latency",
+    "bus_factor_latency",
+    "performance_claims_latency",
+    "license_latency",
+    "size_score_latency",
+    "dataset_and_code_score_latency",
+    "dataset_quality_latency",
+    "code_quality_latency"})
+_REQUIRED_FIELDS = _STRING_FIELDS | _SCORE_FIELDS | _LATENCY_FIELDS
 
+
+def validate_ndjson(record: Dict[str, Any]) -> bool:
     if not isinstance(record, dict):
         return False
-    if not score_fields.issubset(
-        record.keys()) or not latency_fields.issubset(
-        record.keys()) or not string_fields.issubset(
-            record.keys()):
+    if not _REQUIRED_FIELDS.issubset(record.keys()):
         return False
 
-    for string in string_fields:
+    for string in _STRING_FIELDS:
         if not isinstance(record[string], (str, type(None))
                           ) and record[string] is not None:
             return False
 
-    for score in score_fields:
+    for score in _SCORE_FIELDS:
 
         score_metric = record[score]
         # if socre_metric is a dict, check inner values
@@ -120,7 +128,7 @@ def validate_ndjson(record: Dict[str, Any]) -> bool:
                         0.00 <= score_metric <= 1.00):
                     return False
 
-    for latency in latency_fields:
+    for latency in _LATENCY_FIELDS:
 
         latency_metric = record[latency]
         # latency can be none or int (milliseconds)
@@ -240,13 +248,16 @@ def main() -> int:
 
             ndjsons = evaluate_url(models)
 
+            lines = []
             for ndjson in ndjsons.values():
                 if validate_ndjson(ndjson):
-                    print(json.dumps(ndjson, separators=(",", ":")))
+                    lines.append(_encode_compact(ndjson))
                 else:
                     name = ndjson.get("name", "unknown")
-                    print(json.dumps(
+                    lines.append(json.dumps(
                         {"name": name, "error": "Invalid record"}))
+            if lines:
+                sys.stdout.write("\n".join(lines) + "\n")
 
             return 0
 
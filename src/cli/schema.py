@@ -1,6 +1,32 @@
-from urllib.parse import urlparse
 import re
 
+HF_NAME_PATTERN = re.compile(r"https?://huggingface\.co/([^/]+)/([^/]+)")
+
+# Net score weights, summed once at import
+_WEIGHTS = {
+    "size": 0.05,
+    "license": 0.1,
+    "ramp_up_time": 0.1,
+    "bus_factor": 0.1,
+    "availability": 0.15,
+    "dataset_quality": 0.15,
+    "code_quality": 0.15,
+    "performance_claims": 0.2
+}
+_WEIGHTS_SUM = sum(_WEIGHTS.values())
+
+
+def _score(val):
+    if val == 0.0:
+        val = 0.01
+    return float(val) if val is not None else 0.75
+
+
+def _latency(val):
+    if val == 0.0:
+        val = 1
+    return int(val) if val is not None else 10
+
 
 def default_ndjson(
         model,
@@ -28,23 +54,15 @@ def default_ndjson(
         code_quality_latency=None):
 
     if category is not None:
-        hf_match = re.match(r"https?://huggingface\.co/([^/]+)/([^/]+)", model)
+        hf_match = HF_NAME_PATTERN.match(model)
         if hf_match:
             name = hf_match.group(2)
         else:
-            name = model.rstrip("/").split("/")[-1]
+            name = model.rstrip("/").rpartition("/")[2]
     else:
         name = None
 
-    def score(val):
-        if val == 0.0:
-            val = 0.01
-        return float(val) if val is not None else 0.75
-
-    def latency(val):
-        if val == 0.0:
-            val = 1
-        return int(val) if val is not None else 10
+    score, latency = _score, _latency
 
     ndjson = {
         "name": name,
@@ -72,18 +90,7 @@ def default_ndjson(
         "code_quality": score(code_quality),
         "code_quality_latency": latency(code_quality_latency)}
 
-    weights = {
-        "size": 0.05,
-        "license": 0.1,
-        "ramp_up_time": 0.1,
-        "bus_factor": 0.1,
-        "availability": 0.15,
-        "dataset_quality": 0.15,
-        "code_quality": 0.15,
-        "performance_claims": 0.2
-    }
-
-    weights_sum = sum(weights.values())
+    weights, weights_sum = _WEIGHTS, _WEIGHTS_SUM
 
     # add all score values with weights to a netscore
     ndjson["net_score"] = ((ndjson["ramp_up_time"] * weights["ramp_up_time"] + ndjson["bus_factor"] * weights["bus_factor"] + ndjson["performance_claims"] * weights["performance_claims"] + ndjson["license"] * weights["license"] +
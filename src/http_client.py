@@ -0,0 +1,67 @@
+"""Process-wide pooled HTTP session.
+
+Every outbound HTTP call (GitHub, Hugging Face, GenAI Studio) goes through
+get_session(), so keep-alive connections are shared across fetchers. The
+GenAI Studio origin is mounted with its own retry policy, since those are
+POSTs that may be throttled; everything else only retries idempotent
+requests.
+"""
+import os
+import threading
+from urllib.parse import urlsplit
+
+GENAI_DEFAULT_URL = "https://genai.rcac.purdue.edu/api/chat/completions"
+
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+
+
+def _origin(url: str) -> str:
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}/"
+
+
+def _default_retry():
+    from urllib3.util.retry import Retry
+
+    return Retry(total=3, backoff_factor=0.2,
+                 status_forcelist=(502, 503, 504),
+                 allowed_methods=frozenset({"GET", "HEAD"}))
+
+
+def _genai_retry():
+    """Retry transient GenAI failures (POST included) with jittered backoff,
+    honouring Retry-After on 429/503."""
+    from urllib3.util.retry import Retry
+
+    kwargs = dict(total=3, backoff_factor=0.3,
+                  status_forcelist=(429, 500, 502, 503, 504),
+                  allowed_methods=None, respect_retry_after_header=True)
+    try:
+        return Retry(backoff_jitter=0.1, **kwargs)
+    except TypeError:  # urllib3 < 2 has no jitter option
+        return Retry(**kwargs)
+
+
+def get_session():
+    """Return the shared requests.Session, building it on first use."""
+    global _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+
+                session = requests.Session()
+                default = HTTPAdapter(pool_connections=32, pool_maxsize=32,
+                                      max_retries=_default_retry())
+                session.mount("https://", default)
+                session.mount("http://", default)
+                # longest-prefix mount wins, so GenAI gets its own policy
+                genai = HTTPAdapter(pool_connections=10, pool_maxsize=10,
+                                    max_retries=_genai_retry())
+                for url in {GENAI_DEFAULT_URL,
+                            os.getenv("GEN_AI_STUDIO_URL") or GENAI_DEFAULT_URL}:
+                    session.mount(_origin(url), genai)
+                _SESSION = session
+    return _SESSION
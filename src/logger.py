@@ -1,17 +1,34 @@
 """Logger configuration module for the ECE461 project."""
 import logging
 import os
+from typing import Dict, Optional, Tuple
 
+# name -> ((LOG_LEVEL, LOG_FILE, LOG_FILE exists), configured logger). One
+# entry per name, since logging.getLogger(name) is a single shared object;
+# clear this to force reconfiguration
+_LOGGERS: Dict[str, Tuple[Tuple[str, Optional[str], bool], logging.Logger]] = {}
 
-def get_logger(name: str = "team4hope") -> logging.Logger:
-    """Configure and return a logger that respects env variables."""
-    logger = logging.getLogger(name)
 
-    if logger.hasHandlers():
-        logger.handlers.clear()
+def get_logger(name: str = "team4hope") -> logging.Logger:
+    """Configure and return a logger that respects env variables.
 
-    log_level_env = int(os.getenv("LOG_LEVEL", "0"))
+    Repeat calls with the same name and environment return the already
+    configured logger without touching its handlers.
+    """
+    log_level_env = os.getenv("LOG_LEVEL", "0")
     log_file = os.getenv("LOG_FILE")
+    key = (log_level_env, log_file,
+           bool(log_file) and os.path.exists(log_file))
+    cached = _LOGGERS.get(name)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    logger = logging.getLogger(name)
+
+    # reconfiguring: close the old handlers so file descriptors don't leak
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+        handler.close()
 
     try:
         level = int(log_level_env)
@@ -42,4 +59,5 @@ def get_logger(name: str = "team4hope") -> logging.Logger:
         file_handler.setLevel(logger.level)
         file_handler.setFormatter(formatter)
         logger.addHandler(file_handler)
+    _LOGGERS[name] = (key, logger)
     return logger
@@ -27,6 +27,7 @@ from . import llm as _llm
 safe_request = _utils.safe_request
 extract_repo_info = _utils.extract_repo_info
 extract_hf_model_id = _utils.extract_hf_model_id
+classify_url = _utils.classify_url
 check_availability = _utils.check_availability
 
 get_huggingface_model_data = _huggingface.get_huggingface_model_data
@@ -48,6 +49,7 @@ __all__ = [
     "safe_request",
     "extract_repo_info",
     "extract_hf_model_id",
+    "classify_url",
     "check_availability",
     "get_huggingface_model_data",
     "get_huggingface_dataset_data",
@@ -2,7 +2,8 @@
 from __future__ import annotations
 
 import time
-from typing import Any, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Tuple
 
 # Import helper functions from the package namespace so that tests which
 # patch `src.metrics.data_fetcher.<name>` will affect the references used
@@ -13,6 +14,13 @@ from src.logger import get_logger
 logger = get_logger("data_fetcher.aggregator")
 
 
+def _timed(fn: Callable[..., Any], *args: Any) -> Tuple[Any, float]:
+    """Call fn(*args) and return (result, elapsed seconds)."""
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
 def fetch_comprehensive_metrics_data(
         code_url: str, dataset_url: str, model_url: str) -> Dict[str, Any]:
     """
@@ -37,11 +45,24 @@ def fetch_comprehensive_metrics_data(
     }
 
     try:
-        # availability
-        avail_start = time.time()
-        data["availability"] = df.check_availability(
-            code_url, dataset_url, model_url)
-        data["availability_latency"] = time.time() - avail_start
+        is_hf_model = df.classify_url(model_url) == "hf_model"
+        is_hf_dataset = df.classify_url(dataset_url) == "hf_dataset"
+        is_github = df.classify_url(code_url) == "github_repo"
+
+        # The four remote lookups are independent, so issue them together;
+        # each latency is still measured around its own call.
+        with ThreadPoolExecutor(max_workers=4) as ex:
+            avail_fut = ex.submit(
+                _timed, df.check_availability, code_url, dataset_url, model_url)
+            hf_m_fut = ex.submit(
+                _timed, df.get_huggingface_model_data, model_url) if is_hf_model else None
+            hf_d_fut = ex.submit(
+                _timed, df.get_huggingface_dataset_data, dataset_url) if is_hf_dataset else None
+            gh_fut = ex.submit(
+                _timed, df.get_github_repo_data, code_url) if is_github else None
+
+            # availability
+            data["availability"], data["availability_latency"] = avail_fut.result()
 
         # LOCAL ARTIFACT EXAMPLE
         # try:
@@ -61,11 +82,9 @@ def fetch_comprehensive_metrics_data(
 
         # HF model
         hf_model_data = {}  # Store for later use with GitHub files
-        if model_url and "huggingface.co" in model_url and "/datasets/" not in model_url:
-            hf_model_start = time.time()
-            logger.info(f"Fetching HF model data from {model_url}")
-            hf_m = df.get_huggingface_model_data(model_url)
-            data["hf_model_latency"] = time.time() - hf_model_start
+        if hf_m_fut is not None:
+            logger.info(f"Fetched HF model data from {model_url}")
+            hf_m, data["hf_model_latency"] = hf_m_fut.result()
             if hf_m:
                 hf_model_data = hf_m  # Store for later
                 # Extract license from HuggingFace data (takes precedence)
@@ -91,11 +110,9 @@ def fetch_comprehensive_metrics_data(
                 data["performance_details"] = perf_analysis["details"]
 
         # HF dataset
-        if dataset_url and "huggingface.co/datasets" in dataset_url:
-            logger.info(f"Fetching HF dataset data from {dataset_url}")
-            hf_dataset_start = time.time()
-            hf_d = df.get_huggingface_dataset_data(dataset_url)
-            data["hf_dataset_latency"] = time.time() - hf_dataset_start
+        if hf_d_fut is not None:
+            logger.info(f"Fetched HF dataset data from {dataset_url}")
+            hf_d, data["hf_dataset_latency"] = hf_d_fut.result()
             if hf_d:
                 desc = (hf_d.get("description") or "").strip()
                 features = (hf_d.get("features") or "").strip()
@@ -107,11 +124,9 @@ def fetch_comprehensive_metrics_data(
                 }
 
         # GitHub repo
-        if code_url and "github.com" in code_url:
-            logger.info("Fetching GitHub data from %s", code_url)
-            gh_start = time.time()
-            github_data = df.get_github_repo_data(code_url)
-            data["github_latency"] = time.time() - gh_start
+        if gh_fut is not None:
+            logger.info("Fetched GitHub data from %s", code_url)
+            github_data, data["github_latency"] = gh_fut.result()
             if github_data:
                 # Extract license from GitHub data (only if HF license not set)
                 if not data["license"] and github_data.get("license"):
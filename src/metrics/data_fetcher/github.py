@@ -3,14 +3,26 @@ from __future__ import annotations
 
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict
 
-from .utils import safe_request, extract_repo_info
+from .utils import safe_request, extract_repo_info, ttl_cache
 from src.logger import get_logger
 
 logger = get_logger("data_fetcher.github")
 
 
+def _github_answered(data: Dict[str, Any]) -> bool:
+    """True if at least one GitHub endpoint answered.
+
+    On failure the fetcher still returns its zeroed default structure, which
+    must not be cached; repo metadata always carries created_at.
+    """
+    return bool(data.get("created_at") or data.get("files")
+                or data.get("contributors"))
+
+
+@ttl_cache(should_cache=_github_answered)
 def get_github_repo_data(code_url: str) -> Dict[str, Any]:
     """Fetch GitHub repository metadata used by metrics (bus factor, etc.)."""
     owner, repo = extract_repo_info(code_url)
@@ -31,8 +43,19 @@ def get_github_repo_data(code_url: str) -> Dict[str, Any]:
     }
 
     try:
-        repo_resp = safe_request(
-            f"https://api.github.com/repos/{owner}/{repo}", headers=headers)
+        base = f"https://api.github.com/repos/{owner}/{repo}"
+        # the three endpoints are independent; overlap their round trips
+        with ThreadPoolExecutor(max_workers=3) as ex:
+            repo_fut = ex.submit(safe_request, base, headers=headers)
+            contrib_fut = ex.submit(
+                safe_request, f"{base}/contributors", headers=headers)
+            tree_fut = ex.submit(
+                safe_request, f"{base}/git/trees/main?recursive=1",
+                headers=headers)
+            repo_resp = repo_fut.result()
+            contrib_resp = contrib_fut.result()
+            tree_resp = tree_fut.result()
+
         if repo_resp:
             rd = repo_resp.json()
             data.update({
@@ -43,9 +66,6 @@ def get_github_repo_data(code_url: str) -> Dict[str, Any]:
                 "license": (rd.get("license") or {}).get("spdx_id") if rd.get("license") else None,
             })
 
-        contrib_resp = safe_request(
-            f"https://api.github.com/repos/{owner}/{repo}/contributors",
-            headers=headers)
         if contrib_resp:
             lst = contrib_resp.json()
             if isinstance(lst, list) and lst:
@@ -57,17 +77,14 @@ def get_github_repo_data(code_url: str) -> Dict[str, Any]:
                     "total_contributions": total,
                 }
 
-        # try main then master
-        for branch in ("main", "master"):
+        # main was fetched above; only fall back to master if that failed
+        if not (tree_resp and tree_resp.ok):
             tree_resp = safe_request(
-                f"https://api.github.com/repos/{owner}/{repo}/git/trees/{branch}?recursive=1",
-                headers=headers,
-            )
-            if tree_resp and tree_resp.ok:
-                tree = tree_resp.json().get("tree", [])
-                data["files"] = [it["path"]
-                                 for it in tree if it.get("type") == "blob"]
-                break
+                f"{base}/git/trees/master?recursive=1", headers=headers)
+        if tree_resp and tree_resp.ok:
+            tree = tree_resp.json().get("tree", [])
+            data["files"] = [it["path"]
+                             for it in tree if it.get("type") == "blob"]
     except Exception as e:
         logger.debug(f"Failed to fetch GitHub data: {e}")
 
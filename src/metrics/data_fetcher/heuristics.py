@@ -3,7 +3,14 @@ from __future__ import annotations
 
 import math
 import os
-from typing import Any, Dict, List
+import re
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple
+
+
+_SETUP_FILES = frozenset({"setup.py", "pyproject.toml", "setup.cfg"})
+# Any of these in a path marks a benchmark/evaluation artifact
+_BENCHMARK_PATTERN = re.compile("benchmark|eval|test|metric|result")
 
 
 def analyze_code_quality(files: List[str]) -> Dict[str, float]:
@@ -15,14 +22,23 @@ def analyze_code_quality(files: List[str]) -> Dict[str, float]:
             "comment_ratio_norm": 0.5,
             "maintainability_norm": 0.5,
         }
-    py = [f for f in files if f.endswith(".py")]
-    tests = [f for f in files if f.endswith(".py") and "test" in f.lower()]
-    test_coverage_norm = min(1.0, len(tests) / max(1, len(py) * 0.3))
-    has_requirements = any("requirements" in f.lower() for f in files)
-    has_readme = any(os.path.basename(f).lower().startswith("readme")
-                     for f in files)
-    has_setup = any(f in {"setup.py", "pyproject.toml",
-                    "setup.cfg"} for f in files)
+    # One pass over the listing; lowercase each path once
+    py_count = test_count = 0
+    has_requirements = has_readme = has_setup = False
+    basename = os.path.basename
+    for f in files:
+        fl = f.lower()
+        if f.endswith(".py"):
+            py_count += 1
+            if "test" in fl:
+                test_count += 1
+        if not has_requirements and "requirements" in fl:
+            has_requirements = True
+        if not has_readme and basename(fl).startswith("readme"):
+            has_readme = True
+        if not has_setup and f in _SETUP_FILES:
+            has_setup = True
+    test_coverage_norm = min(1.0, test_count / max(1, py_count * 0.3))
     maintainability_norm = (int(has_requirements) +
                             int(has_readme) + int(has_setup)) / 3.0
     return {
@@ -45,24 +61,26 @@ def normalize_stars(stars: int) -> float:
     return min(1.0, math.log10(max(stars, 1)) / 4.0)  # 1e4 -> 1.0
 
 
-def compute_size_scores(total_size_bytes: int) -> Dict[str, float]:
+_SIZE_KEYS = ("raspberry_pi", "jetson_nano", "desktop_pc", "aws_server")
+
+
+@lru_cache(maxsize=1024)
+def _size_scores(total_size_bytes: int) -> Tuple[float, ...]:
     if total_size_bytes <= 0:
-        return {
-            "raspberry_pi": 0.01,
-            "jetson_nano": 0.01,
-            "desktop_pc": 0.01,
-            "aws_server": 0.01}
+        return (0.01, 0.01, 0.01, 0.01)
     mb = 1024 * 1024
     gb = 1024 * mb
     rpi = max(0.01, min(1.0, 1.0 - (total_size_bytes / (100 * mb))))
     jetson = max(0.01, min(1.0, 1.0 - (total_size_bytes / (1 * gb))))
     desktop = max(0.01, min(1.0, 1.0 - (total_size_bytes / (10 * gb))))
     aws = max(0.01, min(1.0, 1.0 - (total_size_bytes / (100 * gb))))
-    return {
-        "raspberry_pi": rpi,
-        "jetson_nano": jetson,
-        "desktop_pc": desktop,
-        "aws_server": aws}
+    return (rpi, jetson, desktop, aws)
+
+
+def compute_size_scores(total_size_bytes: int) -> Dict[str, float]:
+    # The cached scores are an immutable tuple; hand out a fresh dict so
+    # callers can keep mutating their context without poisoning the cache.
+    return dict(zip(_SIZE_KEYS, _size_scores(total_size_bytes)))
 
 
 def analyze_performance_claims(
@@ -120,21 +138,14 @@ def analyze_performance_claims(
 
     # 2. Check for README-like files in GitHub (common performance claim
     # location)
-    readme_files = [f for f in github_files if f.lower(
-    ).startswith('readme') or 'readme' in f.lower()]
-    has_readme = len(readme_files) > 0
+    lowered = [f.lower() for f in github_files]
+    has_readme = any("readme" in f for f in lowered)
     performance_indicators.append(("readme_available", has_readme, 0.1))
     details["readme_available"] = has_readme
 
     # Benchmarking-related files
-    benchmark_files = [
-        f for f in github_files if any(
-            keyword in f.lower() for keyword in [
-                'benchmark',
-                'eval',
-                'test',
-                'metric',
-                'result'])]
+    search = _BENCHMARK_PATTERN.search
+    benchmark_files = [f for f in lowered if search(f)]
     has_benchmark_files = len(benchmark_files) > 0
     performance_indicators.append(
         ("benchmark_files", has_benchmark_files, 0.15))
@@ -5,9 +5,12 @@ import logging
 from typing import Any, Dict, Optional
 from src.logger import get_logger
 
+from .utils import ttl_cache
+
 logger = get_logger("data_fetcher.huggingface")
 
 
+@ttl_cache()
 def get_huggingface_model_data(model_url: str) -> Dict[str, Any]:
     """Fetch HF model metadata via the Hub API."""
     try:
@@ -38,17 +41,11 @@ def get_huggingface_model_data(model_url: str) -> Dict[str, Any]:
         total_size = 0
         try:
             files = api.list_repo_files(model_id, repo_type="model")
-            for fp in files:
-                try:
-                    fi = api.get_paths_info(model_id, fp, repo_type="model")
-                    if fi and len(fi) > 0:  # fi is a list
-                        # Get size from the first (and typically only) RepoFile
-                        # object
-                        size = fi[0].size
-                        if size:
-                            total_size += int(size)
-                except Exception:
-                    continue
+            if files:
+                # one batched lookup instead of a round trip per file
+                infos = api.get_paths_info(model_id, files, repo_type="model")
+                total_size = sum(int(getattr(fi, "size", 0) or 0)
+                                 for fi in infos)
         except Exception:
             pass
         data["total_size_bytes"] = total_size
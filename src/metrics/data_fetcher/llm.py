@@ -6,25 +6,29 @@ endpoint (used by a teammate prototype) and return a metric string.
 from __future__ import annotations
 
 import os
-import requests
 import logging
 import sys
 from typing import Dict, Any
+from src.http_client import GENAI_DEFAULT_URL, get_session
 from src.logger import get_logger
 
+from .utils import ttl_cache
+
 logger = get_logger("data_fetcher.llm")
 
 # Environment-configured endpoint & key (optional)
 PURDUE_GENAI_API_KEY = os.getenv("GEN_AI_STUDIO_API_KEY")
-PURDUE_GENAI_URL = os.getenv(
-    "GEN_AI_STUDIO_URL", "https://genai.rcac.purdue.edu/api/chat/completions")
+PURDUE_GENAI_URL = os.getenv("GEN_AI_STUDIO_URL", GENAI_DEFAULT_URL)
 
 
+@ttl_cache(ttl=24 * 3600, maxsize=512)
 def get_genai_metric_data(model_url: str, prompt: str) -> Dict[str, Any]:
     """Call a GenAI endpoint with a prompt + model_url and return the parsed metric.
 
     Returns a dict with at least 'metric' (string) on success, otherwise an empty dict.
-    This keeps the shape similar to other data_fetcher helpers.
+    This keeps the shape similar to other data_fetcher helpers. The request
+    body is fully determined by (model_url, prompt), so successful answers
+    are memoized for a day.
     """
     if not PURDUE_GENAI_API_KEY:
         logger.debug("GEN AI API key not set; skipping GenAI call")
@@ -42,7 +46,7 @@ def get_genai_metric_data(model_url: str, prompt: str) -> Dict[str, Any]:
     }
 
     try:
-        resp = requests.post(
+        resp = get_session().post(
             PURDUE_GENAI_URL, headers=headers, json=body, timeout=20)
         resp.raise_for_status()
         data = resp.json()
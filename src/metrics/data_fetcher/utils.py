@@ -2,20 +2,80 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, Optional, Tuple
-from urllib.parse import urlparse
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, wraps
+from typing import Any, Callable, Dict, Optional, Tuple
 
 import requests
+from src.http_client import get_session
 from src.logger import get_logger
 
 logger = get_logger("data_fetcher.utils")
 
 
+def _shallow_copy(value: Any) -> Any:
+    if isinstance(value, dict):
+        return dict(value)
+    if isinstance(value, list):
+        return list(value)
+    return value
+
+
+_KWARGS_MARK = object()
+
+
+def ttl_cache(ttl: float = 600.0, maxsize: int = 512,
+              should_cache: Callable[[Any], bool] = bool) -> Callable:
+    """Memoize a fetcher on its arguments for ``ttl`` seconds (LRU-bounded).
+
+    A result is only stored when ``should_cache(result)`` is true (by default,
+    when it is non-empty), so a transient failure is retried on the next call.
+    Positional and keyword spellings of the same call are cached separately.
+    Each caller gets a shallow copy, so mutating a returned dict does not
+    leak into later hits. The wrapper exposes ``cache_clear()`` like
+    ``lru_cache``.
+    """
+    def decorator(fn: Callable[..., Any]) -> Callable[..., Any]:
+        entries: "OrderedDict[Tuple[Any, ...], Tuple[float, Any]]" = OrderedDict()
+        lock = threading.Lock()
+
+        @wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            key = args
+            if kwargs:
+                key += (_KWARGS_MARK,) + tuple(sorted(kwargs.items()))
+            now = time.monotonic()
+            with lock:
+                hit = entries.get(key)
+                if hit is not None and now - hit[0] < ttl:
+                    entries.move_to_end(key)
+                    return _shallow_copy(hit[1])
+            value = fn(*args, **kwargs)
+            if should_cache(value):
+                with lock:
+                    entries[key] = (now, value)
+                    entries.move_to_end(key)
+                    while len(entries) > maxsize:
+                        entries.popitem(last=False)
+            return _shallow_copy(value)
+
+        def cache_clear() -> None:
+            with lock:
+                entries.clear()
+
+        wrapper.cache_clear = cache_clear
+        return wrapper
+    return decorator
+
+
 def safe_request(url: str, timeout: int = 10, **
                  kwargs) -> Optional[requests.Response]:
     """Make a safe HTTP GET request with error handling."""
     try:
-        resp = requests.get(url, timeout=timeout, **kwargs)
+        resp = get_session().get(url, timeout=timeout, **kwargs)
         resp.raise_for_status()
         return resp
     except Exception as e:
@@ -23,13 +83,58 @@ def safe_request(url: str, timeout: int = 10, **
         return None
 
 
+@lru_cache(maxsize=1024)
+def _host_and_parts(url: str) -> Tuple[str, Tuple[str, ...]]:
+    """Split a URL into (lowercased host, non-empty path segments)."""
+    s = url.strip()
+    # optional scheme, then drop any query/fragment before splitting
+    if s[:8].lower() == "https://":
+        s = s[8:]
+    elif s[:7].lower() == "http://":
+        s = s[7:]
+    s = s.partition("#")[0].partition("?")[0]
+    host, _, path = s.partition("/")
+    if not host:
+        return "", ()
+    return host.lower(), tuple(p for p in path.split("/") if p)
+
+
+# host -> URL kind; Hugging Face is refined by the first path segment.
+# Only exact hosts the extractors understand: subdomains such as
+# gist.github.com and short hosts such as hf.co are "unknown".
+_HOST_KIND = {
+    "huggingface.co": "hf",
+    "www.huggingface.co": "hf",
+    "github.com": "github_repo",
+    "www.github.com": "github_repo",
+    "gitlab.com": "gitlab_repo",
+    "www.gitlab.com": "gitlab_repo",
+}
+_HF_PATH_KIND = {"datasets": "hf_dataset", "spaces": "hf_space"}
+
+
+def classify_url(url: str) -> str:
+    """Classify a URL as hf_model, hf_dataset, hf_space, github_repo,
+    gitlab_repo or unknown from its host (one dict probe, www. tolerated)."""
+    if not url:
+        return "unknown"
+    host, parts = _host_and_parts(url)
+    kind = _HOST_KIND.get(host)
+    if kind is None:
+        return "unknown"
+    if kind == "hf":
+        if not parts:
+            return "unknown"
+        return _HF_PATH_KIND.get(parts[0], "hf_model")
+    return kind
+
+
 def extract_repo_info(github_url: str) -> Tuple[Optional[str], Optional[str]]:
     """Extract (owner, repo) from a GitHub URL."""
     try:
         if "github.com" not in github_url:
             return None, None
-        path = urlparse(github_url).path.strip("/")
-        parts = path.split("/")
+        _, parts = _host_and_parts(github_url)
         if len(parts) >= 2:
             return parts[0], parts[1]
     except Exception:
@@ -43,8 +148,7 @@ def extract_hf_model_id(hf_url: str) -> Optional[str]:
         if "huggingface.co" not in hf_url:
             return None
 
-        path = urlparse(hf_url).path.strip("/")
-        parts = path.split("/")
+        _, parts = _host_and_parts(hf_url)
 
         # datasets/<id>  OR  datasets/<owner>/<name>
         if parts and parts[0] == "datasets":
@@ -69,24 +173,30 @@ def extract_hf_model_id(hf_url: str) -> Optional[str]:
     return None
 
 
+def _probe(pair: Tuple[str, str]) -> Tuple[str, bool]:
+    """HEAD one URL; True for a 200 or a redirect."""
+    name, url = pair
+    try:
+        r = get_session().head(url, timeout=10, allow_redirects=True)
+        return name, r.status_code in (200, 301, 302)
+    except Exception as e:
+        logger.debug(f"Failed to check {name} URL {url}: {e}")
+        return name, False
+
+
 def check_availability(code_url: str, dataset_url: str,
                        model_url: str) -> Dict[str, Any]:
     """HEAD the URLs and report availability of each and overall links_ok."""
     results = {"has_code": False, "has_dataset": False,
                "has_model": False, "links_ok": False}
-    urls = [("code", code_url), ("dataset", dataset_url), ("model", model_url)]
-    ok = 0
-    for name, url in urls:
-        if url and url.strip():
-            try:
-                r = requests.head(url, timeout=10, allow_redirects=True)
-                good = r.status_code in (200, 301, 302)
+    pairs = [(name, url) for name, url in
+             (("code", code_url), ("dataset", dataset_url), ("model", model_url))
+             if url and url.strip()]
+    if pairs:
+        # the probes are independent, so overlap their round trips
+        with ThreadPoolExecutor(max_workers=len(pairs)) as ex:
+            for name, good in ex.map(_probe, pairs):
                 results[f"has_{name}"] = good
-                ok += int(good)
-            except Exception as e:
-                logger.debug(f"Failed to check {name} URL {url}: {e}")
-                results[f"has_{name}"] = False
-        else:
-            results[f"has_{name}"] = False
+    ok = sum(results[f"has_{name}"] for name in ("code", "dataset", "model"))
     results["links_ok"] = ok >= 2
     return results
@@ -1,7 +1,7 @@
 """Availability metric implementation."""
 from __future__ import annotations
 from typing import Dict, Any
-from ..types import MetricResult
+from ..types import EMPTY, MetricResult
 
 
 class AvailabilityMetric:
@@ -14,19 +14,19 @@ class AvailabilityMetric:
     def compute(self, context: Dict[str, Any]) -> MetricResult:
         """Compute availability metric based on link availability data."""
         import time
-        start = time.time()
-        availability = context.get("availability", {})
+        start = time.perf_counter()
+        availability = context.get("availability", EMPTY)
         
         # Get individual components
         has_code = availability.get("has_code", False)
         has_dataset = availability.get("has_dataset", False) 
         links_ok = availability.get("links_ok", False)
         
-        # Calculate value as average of the three components
-        components = [has_code, has_dataset, links_ok]
-        value = sum(components) / len(components)
+        # Fraction of the three flags that are set, via a popcount
+        bits = bool(has_code) << 2 | bool(has_dataset) << 1 | bool(links_ok)
+        value = bits.bit_count() / 3
         
-        seconds = time.time() - start
+        seconds = time.perf_counter() - start
         return MetricResult(
             self.id,
             value,
@@ -1,10 +1,17 @@
 """Bus factor metric implementation with GenAI analysis."""
 from __future__ import annotations
 from typing import Dict, Any
-from ..types import MetricResult
+from ..types import EMPTY, MetricResult
 from ..data_fetcher import get_genai_metric_data
 
 
+def _clamp01(v: float) -> float:
+    """Clamp to [0, 1] without min/max calls; NaN maps to 0.0."""
+    if 0.0 <= v <= 1.0:
+        return v
+    return 1.0 if v > 1.0 else 0.0
+
+
 class BusFactorMetric:
     """
     Evaluate bus factor (contribution distribution) using GenAI LLM analysis.
@@ -21,7 +28,7 @@ class BusFactorMetric:
         """Compute bus factor metric using GenAI analysis with fallback to heuristics."""
         import time
         import re
-        start = time.time()
+        start = time.perf_counter()
 
         # Get model URL from context for GenAI analysis
         model_url = context.get("model_url", "")
@@ -32,14 +39,14 @@ class BusFactorMetric:
 
         if not target_url:
             # Fallback to original heuristic method
-            meta = context.get("repo_meta", {})
+            meta = context.get("repo_meta", EMPTY)
             top_pct = float(meta.get("top_contributor_pct", 1.0))
             # Traditional bus factor: higher = better (1 - top_pct)
             # But for knowledge concentration: higher = worse
             # So we need to invert: high top_contributor_pct = low bus factor
             # Invert for traditional bus factor
-            value = min(1.0, max(0.0, 1.0 - top_pct))
-            seconds = time.time() - start
+            value = _clamp01(1.0 - top_pct)
+            seconds = time.perf_counter() - start
             return MetricResult(self.id, value, details={
                 "fallback": "no_url",
                 "top_contributor_pct": top_pct,
@@ -117,10 +124,10 @@ URL:"""
 
         except Exception as exc:
             # Fallback to original heuristic method
-            meta = context.get("repo_meta", {})
+            meta = context.get("repo_meta", EMPTY)
             top_pct = float(meta.get("top_contributor_pct", 1.0))
             # Traditional bus factor calculation
-            value = min(1.0, max(0.0, 1.0 - top_pct))
+            value = _clamp01(1.0 - top_pct)
             details = {
                 "error": str(exc)[:100],
                 "fallback": "heuristic_method",
@@ -128,7 +135,7 @@ URL:"""
                 "method": "heuristic"
             }
 
-        seconds = time.time() - start
+        seconds = time.perf_counter() - start
         return MetricResult(
             self.id,
             value,
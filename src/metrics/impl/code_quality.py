@@ -1,7 +1,10 @@
 """Code quality metric implementation with GenAI analysis."""
 from __future__ import annotations
 from typing import Dict, Any
-from ..types import MetricResult
+from ..types import EMPTY, MetricResult
+
+_COMPONENT_KEYS = ("test_coverage_norm", "style_norm",
+                   "comment_ratio_norm", "maintainability_norm")
 
 
 class CodeQualityMetric:
@@ -13,13 +16,11 @@ class CodeQualityMetric:
     def compute(self, context: Dict[str, Any]) -> MetricResult:
         """Compute code quality metric using traditional metrics."""
         import time
-        start = time.time()
-        code_quality = context.get("code_quality", {})
-        keys = ("test_coverage_norm", "style_norm",
-                "comment_ratio_norm", "maintainability_norm")
-        vals = [float(code_quality[k]) for k in keys if k in code_quality]
+        start = time.perf_counter()
+        code_quality = context.get("code_quality", EMPTY)
+        vals = [float(code_quality[k]) for k in _COMPONENT_KEYS if k in code_quality]
         value = sum(vals) / len(vals) if vals else 0.0
-        seconds = time.time() - start
+        seconds = time.perf_counter() - start
         return MetricResult(
             self.id,
             value,
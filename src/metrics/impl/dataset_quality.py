@@ -1,7 +1,7 @@
 """Dataset quality metric implementation with GenAI analysis."""
 from __future__ import annotations
 from typing import Dict, Any
-from ..types import MetricResult
+from ..types import EMPTY, MetricResult
 from ..data_fetcher import get_genai_metric_data
 
 
@@ -16,14 +16,14 @@ class DatasetQualityMetric:
         """Compute dataset quality metric using GenAI analysis with fallback to heuristics."""
         import time
         import re
-        start = time.time()
+        start = time.perf_counter()
 
         # Get the dataset URL from context
         dataset_url = context.get("dataset_url", "")
 
         if not dataset_url:
             # Fallback to original implementation if no dataset URL
-            data_quality = context.get("dataset_quality", {})
+            data_quality = context.get("dataset_quality", EMPTY)
             vals = [
                 float(
                     data_quality[k]) for k in (
@@ -31,7 +31,7 @@ class DatasetQualityMetric:
                     "documentation",
                     "class_balance") if k in data_quality]
             value = sum(vals) / len(vals) if vals else 0.0
-            seconds = time.time() - start
+            seconds = time.perf_counter() - start
             return MetricResult(self.id, value, details={
                 "fallback": "no_dataset_url",
                 "components": vals
@@ -73,7 +73,7 @@ Respond with only the numerical score (e.g., 0.75). Dataset URL:"""
                     value = max(0.0, raw_score)
             else:
                 # If no score found, fall back to original method
-                data_quality = context.get("dataset_quality", {})
+                data_quality = context.get("dataset_quality", EMPTY)
                 vals = [
                     float(
                         data_quality[k]) for k in (
@@ -92,7 +92,7 @@ Respond with only the numerical score (e.g., 0.75). Dataset URL:"""
 
         except Exception as exc:
             # Fallback to original implementation on error
-            data_quality = context.get("dataset_quality", {})
+            data_quality = context.get("dataset_quality", EMPTY)
             vals = [
                 float(
                     data_quality[k]) for k in (
@@ -107,7 +107,7 @@ Respond with only the numerical score (e.g., 0.75). Dataset URL:"""
                 "components": vals
             }
 
-        seconds = time.time() - start
+        seconds = time.perf_counter() - start
         return MetricResult(
             self.id,
             value,
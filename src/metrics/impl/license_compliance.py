@@ -1,9 +1,50 @@
 from __future__ import annotations
-from typing import Dict, Any
+from typing import Any, Dict, Optional, Pattern, Tuple
 from ..types import MetricResult
 from src.metrics.data_fetcher.huggingface import get_huggingface_file
+from functools import lru_cache
 import re
 
+
+@lru_cache(maxsize=64)
+def _allow_matcher(allow: frozenset) -> Tuple[Optional[Pattern[str]], Dict[str, str]]:
+    """One compiled alternation over the allow-list, plus lowercase -> entry.
+
+    Alternatives are longest first so e.g. "bsd-3-clause" wins over "bsd",
+    and the whole list is matched in a single regex pass.
+    """
+    by_lower = {lic.lower(): lic for lic in allow if lic}
+    if not by_lower:
+        return None, by_lower
+    alts = sorted(by_lower, key=len, reverse=True)
+    pattern = re.compile(r"\b(?:" + "|".join(map(re.escape, alts)) + r")\b")
+    return pattern, by_lower
+
+
+@lru_cache(maxsize=256)
+def _license_in_readme(readme_path: str, allow: frozenset) -> str:
+    """First allowed license named in the README ('' if none).
+
+    hf_hub_download paths live under a commit-specific snapshot, so a path
+    always names the same content and the scan can be memoized.
+    """
+    with open(readme_path, "r", encoding="utf-8") as f:
+        readme_text = f.read().lower()
+    pattern, by_lower = _allow_matcher(allow)
+    m = pattern.search(readme_text) if pattern is not None else None
+    return by_lower[m.group(0)] if m else ""
+
+
+@lru_cache(maxsize=1024)
+def _license_in_text(license_lower: str, allow: frozenset) -> str:
+    """First allowed license matching a declared license string ('' if none)."""
+    pattern, by_lower = _allow_matcher(allow)
+    if license_lower in by_lower:
+        return by_lower[license_lower]
+    m = pattern.search(license_lower) if pattern is not None else None
+    return by_lower[m.group(0)] if m else ""
+
+
 class LicenseComplianceMetric:
     """
     1 if a compatible license string is detected, else 0. 'compatible_licenses' may be provided in context.
@@ -25,15 +66,18 @@ class LicenseComplianceMetric:
         "lgpl-lr", "deepfloyd-if-license", "fair-noncommercial-research-license", "llama2", "llama3",
         "llama3.1", "llama3.2", "llama3.3", "llama4", "grok2-community", "gemma", "unknown", "other"
     ]
+    # Built once so the per-call cache key is the same object every time
+    _DEFAULT_ALLOW = frozenset(DEFAULT_COMPATIBLE_LICENSES)
 
     def compute(self, context: Dict[str, Any]) -> MetricResult:
         import time
-        start = time.time()
+        start = time.perf_counter()
         
         # Check if license is directly provided in context
         license_from_context = context.get("license", "")
         model_url = context.get("model_url", "")
-        allow = set(context.get("compatible_licenses", self.DEFAULT_COMPATIBLE_LICENSES))
+        custom = context.get("compatible_licenses")
+        allow = self._DEFAULT_ALLOW if custom is None else frozenset(custom)
         detected_license = ""
         value = 0.0
 
@@ -47,27 +91,20 @@ class LicenseComplianceMetric:
 
             if readme_path:
                 try:
-                    with open(readme_path, "r", encoding="utf-8") as f:
-                        readme_text = f.read().lower()
-                        # Search for license keywords in the README
-                        for lic in allow:
-                            if re.search(rf"\b{re.escape(lic)}\b", readme_text):
-                                detected_license = lic
-                                value = 1.0
-                                break
+                    detected_license = _license_in_readme(readme_path, allow)
+                    if detected_license:
+                        value = 1.0
                 except Exception:
                     pass
 
         # If no license found in local artifact, try context as fallback
         if not detected_license and license_from_context:
-            license_lower = license_from_context.lower().strip()
-            for lic in allow:
-                if lic.lower() == license_lower or re.search(rf"\b{re.escape(lic)}\b", license_lower):
-                    detected_license = lic
-                    value = 1.0
-                    break
-            # If no match found, store the original license for details
-            if not detected_license:
+            detected_license = _license_in_text(
+                license_from_context.lower().strip(), allow)
+            if detected_license:
+                value = 1.0
+            else:
+                # If no match found, store the original license for details
                 detected_license = license_from_context
 
         # This section is now redundant since we already checked above
@@ -75,5 +112,5 @@ class LicenseComplianceMetric:
         if not detected_license and model_url:
             pass  # Already handled above
 
-        seconds = time.time() - start
+        seconds = time.perf_counter() - start
         return MetricResult(self.id, value, details={"license": detected_license}, binary=0, seconds=seconds)
\ No newline at end of file
@@ -1,6 +1,27 @@
 from __future__ import annotations
 from typing import Dict, Any
-from ..types import MetricResult
+from ..types import EMPTY, MetricResult
+import re
+
+# Well-known models with established benchmarks get 1.0
+_WELL_KNOWN_PATTERNS = (
+    "bert",
+    "gpt",
+    "llama",
+    "mistral",
+    "claude",
+    "gemma",
+    "phi",
+    "qwen",
+    "t5",
+    "roberta",
+    "distilbert",
+    "electra",
+    "deberta",
+    "whisper",  # OpenAI's speech model
+)
+# Substring match on any of them in a single scan of the URL
+_WELL_KNOWN_RE = re.compile("|".join(map(re.escape, _WELL_KNOWN_PATTERNS)))
 
 class PerformanceClaimsMetric:
     """
@@ -11,7 +32,7 @@ class PerformanceClaimsMetric:
 
     def compute(self, context: Dict[str, Any]) -> MetricResult:
         import time
-        start = time.time()
+        start = time.perf_counter()
         
         # Binary performance claims logic - ALL models get either 0.0 or 1.0
         model_url = context.get("model_url", "") or ""
@@ -24,39 +45,19 @@ class PerformanceClaimsMetric:
             value = 0.0
             details = {"mode": "binary", "has_performance_claims": False}
         
-        seconds = time.time() - start
+        seconds = time.perf_counter() - start
         return MetricResult(self.id, value, details=details, binary=0, seconds=seconds)
     
     def _has_good_performance_claims(self, model_url: str, context: Dict[str, Any]) -> bool:
         """Binary decision: Does this model have good performance claims? (0 or 1)"""
         model_url = model_url.lower()
         
-        # Well-known models with established benchmarks get 1.0
-        well_known_patterns = [
-            "bert",
-            "gpt", 
-            "llama",
-            "mistral",
-            "claude",
-            "gemma",
-            "phi",
-            "qwen",
-            "t5",
-            "roberta", 
-            "distilbert",
-            "electra",
-            "deberta",
-            "whisper"  # OpenAI's speech model
-        ]
-        
         # Check if it's a well-known model from a reputable source
-        if "huggingface.co" in model_url:
-            for pattern in well_known_patterns:
-                if pattern in model_url:
-                    return True
+        if "huggingface.co" in model_url and _WELL_KNOWN_RE.search(model_url):
+            return True
         
         # Check for high-quality indicators from context
-        ramp_data = context.get("ramp", {})
+        ramp_data = context.get("ramp", EMPTY)
         if isinstance(ramp_data, dict):
             downloads_norm = ramp_data.get("downloads_norm", 0)
             likes_norm = ramp_data.get("likes_norm", 0)
@@ -65,7 +66,7 @@ class PerformanceClaimsMetric:
                 return True
         
         # Check for complete package (code + dataset + model)
-        availability = context.get("availability", {})
+        availability = context.get("availability", EMPTY)
         if isinstance(availability, dict):
             if (availability.get("has_code") and 
                 availability.get("has_dataset") and 
@@ -1,7 +1,7 @@
 """Ramp-up time metric implementation."""
 from __future__ import annotations
 from typing import Dict, Any
-from ..types import MetricResult
+from ..types import EMPTY, MetricResult
 
 
 class RampUpTimeMetric:
@@ -14,9 +14,9 @@ class RampUpTimeMetric:
     def compute(self, context: Dict[str, Any]) -> MetricResult:
         """Compute ramp-up time metric."""
         import time
-        start = time.time()
-        r = context.get("ramp", {})
+        start = time.perf_counter()
+        r = context.get("ramp", EMPTY)
         vals = [float(r[k]) for k in ("likes_norm", "downloads_norm", "recency_norm") if k in r]
         value = sum(vals) / len(vals) if vals else 0.0
-        seconds = time.time() - start
+        seconds = time.perf_counter() - start
         return MetricResult(self.id, value, details={"components": vals}, binary=0, seconds=seconds)
@@ -11,7 +11,21 @@ See: Preliminary Design rubric (ECE30861) for justification.
 
 import time
 from typing import Dict, Any
-from src.metrics.types import MetricResult
+from src.metrics.types import EMPTY, MetricResult
+
+
+# Expected hardware-specific keys
+_HARDWARE_KEYS = ("raspberry_pi", "jetson_nano", "desktop_pc", "aws_server")
+
+
+def _coerce(raw: Any) -> float:
+    # None is the common "missing" value; skip raising for it
+    if raw is None:
+        return 0.0
+    try:
+        return float(raw)
+    except (TypeError, ValueError):
+        return 0.0
 
 
 class SizeMetric:
@@ -22,26 +36,17 @@ class SizeMetric:
 
     def compute(self, context: Dict[str, Any]) -> MetricResult:
         """Compute size metric based on normalized size scores across different hardware targets."""
-        start = time.time()
-        context_data = context.get("size_components", {})
-
-        # Expected hardware-specific keys
-        hardware_keys = ["raspberry_pi",
-                         "jetson_nano", "desktop_pc", "aws_server"]
-
-        size_score = {}
-        for hw in hardware_keys:
-            try:
-                size_score[hw] = float(context_data.get(
-                    hw, 0.0))  # default to 0 if missing
-            except (TypeError, ValueError):
-                size_score[hw] = 0.0
-
-        # Compute overall value as the mean of available hardware scores
-        value = sum(size_score.values()) / \
-            len(size_score) if size_score else 0.0
-
-        seconds = time.time() - start
+        start = time.perf_counter()
+        context_data = context.get("size_components", EMPTY)
+
+        # default to 0 if missing
+        get = context_data.get
+        size_score = {hw: _coerce(get(hw, 0.0)) for hw in _HARDWARE_KEYS}
+
+        # Overall value is the mean over the fixed set of hardware targets
+        value = sum(size_score.values()) / len(_HARDWARE_KEYS)
+
+        seconds = time.perf_counter() - start
         return MetricResult(
             id=self.id,
             value=value,
@@ -1,12 +1,12 @@
 from __future__ import annotations
-from typing import Dict, List, Any
+from typing import Dict, Any, Sequence
 from .types import MetricResult
 from .operationalization import Operationalization
 
 
 def netscore(
     results: Dict[str, MetricResult],
-    ops: List[Operationalization]
+    ops: Sequence[Operationalization]
 ) -> Dict[str, Any]:
     comps = []
     total_w = 0.0
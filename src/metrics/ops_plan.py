@@ -1,4 +1,5 @@
 from __future__ import annotations
+from typing import Tuple
 from .operationalization import Operationalization
 
 # Weights & metric set taken from the Milestone 1 plan's Net Score table.
@@ -6,7 +7,7 @@ from .operationalization import Operationalization
 # Availability (Code+Data) (0.15), DatasetQuality(0.15),
 # CodeQuality(0.15), PerformanceClaims(0.20).
 
-default_ops = [
+default_ops: Tuple[Operationalization, ...] = (
     Operationalization("size", {}, 0.05, "minmax", {
                        "min": 0.0, "max": 1.0}, True),
     Operationalization("license_compliance", {}, 0.10, "identity", {}, True),
@@ -21,4 +22,4 @@ default_ops = [
                        {"min": 0.0, "max": 1.0}, True),
     Operationalization("performance_claims", {}, 0.20,
                        "minmax", {"min": 0.0, "max": 1.0}, True),
-]
+)
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, Sequence, Tuple
 from .types import MetricResult
 from .registry import MetricRegistry
 from .operationalization import Operationalization, normalize, binarize
@@ -8,11 +8,14 @@ from .timing import time_call
 
 # NEW imports for parallelism
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 import os
 import time
 
 
-def build_registry_from_plan() -> MetricRegistry:
+@lru_cache(maxsize=1)
+def _plan_metrics() -> tuple:
+    # Metrics are stateless, so the instances are built once and shared
     from .impl.size import SizeMetric
     from .impl.license_compliance import LicenseComplianceMetric
     from .impl.ramp_up_time import RampUpTimeMetric
@@ -22,15 +25,24 @@ def build_registry_from_plan() -> MetricRegistry:
     from .impl.code_quality import CodeQualityMetric
     from .impl.performance_claims import PerformanceClaimsMetric
 
+    return (
+        SizeMetric(),
+        LicenseComplianceMetric(),
+        RampUpTimeMetric(),
+        BusFactorMetric(),
+        AvailabilityMetric(),
+        DatasetQualityMetric(),
+        CodeQualityMetric(),
+        PerformanceClaimsMetric(),
+    )
+
+
+def build_registry_from_plan() -> MetricRegistry:
+    # A fresh registry per call, so callers may register extra metrics
+    # without leaking them into other rows or runs.
     reg = MetricRegistry()
-    reg.register(SizeMetric())
-    reg.register(LicenseComplianceMetric())
-    reg.register(RampUpTimeMetric())
-    reg.register(BusFactorMetric())
-    reg.register(AvailabilityMetric())
-    reg.register(DatasetQualityMetric())
-    reg.register(CodeQualityMetric())
-    reg.register(PerformanceClaimsMetric())
+    for metric in _plan_metrics():
+        reg.register(metric)
     return reg
 
 
@@ -55,7 +67,7 @@ def _compute_one(op: Operationalization, metric,
 
 
 def run_metrics(
-    ops: List[Operationalization],
+    ops: Sequence[Operationalization],
     context: Dict[str, Any],
     registry: MetricRegistry | None = None,
     *,
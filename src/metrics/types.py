@@ -1,9 +1,14 @@
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import Any, Dict, Protocol
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Protocol
 
+# Shared read-only default for missing context sections, so a miss in
+# context.get(section, EMPTY) does not allocate a fresh dict per metric call.
+EMPTY: Mapping[str, Any] = MappingProxyType({})
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class MetricResult:
     id: str
     value: float        # 0..1 continuous score from the metric
@@ -10,17 +10,28 @@ Phase-1 constraints:
 """
 from __future__ import annotations
 
-from typing import Dict, List, Literal, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Literal, NamedTuple, Optional, Tuple
+import atexit
+import hashlib
+import json
 import logging
 import os
 import re
+import sys
+import tempfile
+import time
 
-import requests
+try:  # optional linear-time (DFA) engine for scanning free-text replies
+    import re2 as _re_engine
+except ImportError:
+    _re_engine = re
 
+# requests and the metrics pipeline are imported where they are used so
+# classification-only callers (e.g. url_parsers.detect) import quickly.
 from src.cli.schema import default_ndjson
-from src.metrics.ops_plan import default_ops
-from src.metrics.runner import run_metrics
-from src.metrics.data_fetcher import fetch_comprehensive_metrics_data
+from src.http_client import GENAI_DEFAULT_URL, get_session
 
 logger = logging.getLogger(__name__)
 
@@ -28,8 +39,9 @@ UrlCategory = Literal["MODEL", "DATASET", "CODE"]
 
 
 # URL patterns
+# Datasets and Spaces share the host; exclude them up front
 HF_MODEL_PATTERN = re.compile(
-    r"^https://huggingface\.co/[^/]+/[^/]+($|/tree/|/blob/|/main|/resolve/)")
+    r"^https://huggingface\.co/(?!datasets/|spaces/)[^/]+/[^/]+($|/tree/|/blob/|/main|/resolve/)")
 HF_DATASET_PATTERN = re.compile(
     r"^https://huggingface\.co/datasets/[^/]+/[^/]+($|/tree/|/blob/|/main|/resolve/)")
 GITHUB_CODE_PATTERN = re.compile(
@@ -38,29 +50,57 @@ GITLAB_CODE_PATTERN = re.compile(
     r"^https://gitlab\.com/[^/]+/[^/]+($|/tree/|/blob/|/main|/commit/|/releases/)")
 HF_SPACES_PATTERN = re.compile(
     r"^https://huggingface\.co/spaces/[^/]+/[^/]+($|/tree/|/blob/|/main|/commit/|/releases/)")
+# Any accepted code host (GitHub, GitLab, HF Spaces) in a single scan
+CODE_URL_PATTERN = re.compile(
+    r"^https://(?:github\.com|gitlab\.com|huggingface\.co/spaces)/[^/]+/[^/]+"
+    r"($|/tree/|/blob/|/main|/commit/|/releases/)")
+# First URL in a free-text GenAI reply
+URL_IN_TEXT_PATTERN = _re_engine.compile(r"https?://\S+")
+# Outermost JSON object in a free-text GenAI reply
+JSON_OBJECT_PATTERN = re.compile(r"\{.*\}", re.DOTALL)
+
+# Note: always call the bound methods on these compiled objects
+# (PATTERN.match(url)) rather than re.match(PATTERN, url).
 
 
 # Purdue GenAI Studio
 PURDUE_GENAI_API_KEY = os.getenv("GEN_AI_STUDIO_API_KEY")
-PURDUE_GENAI_URL = "https://genai.rcac.purdue.edu/api/chat/completions"
+PURDUE_GENAI_URL = GENAI_DEFAULT_URL
+
+# Outer pools are kept small because each row already fans out inside the
+# fetchers (aggregator 4, GitHub 3, availability 3). Four rows at a time
+# stay within the shared session's 32-connection pool, and the GenAI fill
+# pool is sized to that origin's 10-connection adapter.
+ROW_WORKERS = 4
+GENAI_FILL_WORKERS = 8
+
+
+class UrlCtx(NamedTuple):
+    """The links of one input row: [code_url, dataset_url, model_url]."""
+    code_url: Optional[str]
+    dataset_url: Optional[str]
+    model_url: Optional[str]
+
 
 # ---------- helpers ----------
 
 
+@lru_cache(maxsize=4096)
 def _valid_code_url(url: Optional[str]) -> bool:
-    if url:
-        if GITHUB_CODE_PATTERN.match(url):
-            return True
-        if GITLAB_CODE_PATTERN.match(url):
-            return True
-        if HF_SPACES_PATTERN.match(url):
-            return True
+    if url and CODE_URL_PATTERN.match(url):
+        return True
     return False
 
 
+@lru_cache(maxsize=4096)
+def _valid_dataset_url_regex(url: str) -> bool:
+    return HF_DATASET_PATTERN.match(url) is not None
+
+
 def _valid_dataset_url(url: Optional[str]) -> bool:
+    # Only the regex check is memoized; the GenAI answer must not be pinned.
     if url:
-        if HF_DATASET_PATTERN.match(url):
+        if _valid_dataset_url_regex(url):
             return True
         # Fallback: ask GenAI if this is a valid dataset URL (for other
         # sources)
@@ -71,45 +111,53 @@ def _valid_dataset_url(url: Optional[str]) -> bool:
     return False
 
 
+@lru_cache(maxsize=4096)
 def _valid_model_url(url: Optional[str]) -> bool:
     if url and HF_MODEL_PATTERN.match(url):
         return True
     return False
 
 
-def _genai_single_url(prompt: str) -> Optional[str]:
+def _genai_chat(prompt: str, system: str) -> Optional[str]:
     """
-    Call Purdue GenAI Studio with a constrained prompt that should return a single URL.
-    Returns None on any error or if not configured. Satisfies the Phase-1 LLM usage.
+    Send one chat completion to Purdue GenAI Studio and return the reply text.
+    Returns None on any error or if not configured.
     """
     if not PURDUE_GENAI_API_KEY:
         logger.info("GEN_AI_STUDIO_API_KEY not set; skipping GenAI enrichment.")
         return None
     try:
-        headers = {
-            "Authorization": f"Bearer {PURDUE_GENAI_API_KEY}",
-            "Content-Type": "application/json",
-        }
+        headers = {"Authorization": f"Bearer {PURDUE_GENAI_API_KEY}"}
         body = {
             "model": "llama3.1:latest",
             "messages": [
-                {"role": "system", "content": "Reply with exactly one URL and nothing else."},
+                {"role": "system", "content": system},
                 {"role": "user", "content": prompt},
             ],
             "temperature": 0,
         }
-        resp = requests.post(
+        resp = get_session().post(
             PURDUE_GENAI_URL, headers=headers, json=body, timeout=15)
         resp.raise_for_status()
         data = resp.json()
-        text: str = data["choices"][0]["message"]["content"].strip()
-        m = re.search(r"https?://\S+", text)
-        return m.group(0) if m else None
+        return data["choices"][0]["message"]["content"].strip()
     except Exception as e:
         logger.warning(f"GenAI call failed: {e}")
         return None
 
 
+def _genai_single_url(prompt: str) -> Optional[str]:
+    """
+    Call Purdue GenAI Studio with a constrained prompt that should return a single URL.
+    Returns None on any error or if not configured. Satisfies the Phase-1 LLM usage.
+    """
+    text = _genai_chat(prompt, "Reply with exactly one URL and nothing else.")
+    if not text:
+        return None
+    m = URL_IN_TEXT_PATTERN.search(text)
+    return m.group(0) if m else None
+
+
 def get_code_url_from_genai(model_url: str) -> Optional[str]:
     url = _genai_single_url(
         f"Given the model URL {model_url}, what is the corresponding code repository URL? Only provide the URL."
@@ -124,6 +172,50 @@ def get_dataset_url_from_genai(model_url: str) -> Optional[str]:
     return url if _valid_dataset_url(url) else None
 
 
+def get_urls_from_genai(model_url: str) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Ask GenAI for both the code and dataset URL of a model in one request.
+
+    Returns (code_url, dataset_url); each is None if missing or invalid.
+    """
+    text = _genai_chat(
+        f"Given the model URL {model_url}, return the corresponding code repository "
+        f"URL and dataset URL as JSON: "
+        f'{{"code_url": "<url or null>", "dataset_url": "<url or null>"}}',
+        "Reply with a single JSON object and nothing else.",
+    )
+    if not text:
+        return None, None
+    m = JSON_OBJECT_PATTERN.search(text)
+    try:
+        data = json.loads(m.group(0)) if m else {}
+    except ValueError:
+        data = {}
+    if not isinstance(data, dict):
+        return None, None
+
+    code_url = data.get("code_url")
+    dataset_url = data.get("dataset_url")
+    code_url = code_url if isinstance(code_url, str) and _valid_code_url(code_url) else None
+    dataset_url = dataset_url if isinstance(
+        dataset_url, str) and _valid_dataset_url(dataset_url) else None
+    return code_url, dataset_url
+
+
+def _fill_missing_links(links: List[Optional[str]]) -> None:
+    """Fill a row's missing code/dataset links in place via Purdue GenAI Studio."""
+    code_url, dataset_url, model_url = links[0], links[1], links[2]
+    # One request covers both the code and dataset link.
+    need_code = not _valid_code_url(code_url)
+    need_dataset = not _valid_dataset_url(dataset_url)
+    if need_code or need_dataset:
+        filled_code, filled_dataset = get_urls_from_genai(model_url)
+        if need_code and filled_code:
+            links[0] = filled_code
+        if need_dataset and filled_dataset:
+            links[1] = filled_dataset
+
+
 def get_url_category(models: Dict[str,
                                   List[Optional[str]]]) -> Dict[str,
                                                                 Optional[UrlCategory]]:
@@ -134,6 +226,9 @@ def get_url_category(models: Dict[str,
     Returns a dict with the same keys mapping to the inferred UrlCategory.
     """
     categories: Dict[str, Optional[UrlCategory]] = {}
+    to_fill: List[List[Optional[str]]] = []
+    # local binding: this loop runs once per input row
+    queue_fill = to_fill.append
     for key, links in models.items():
         # normalize to a mutable list of length 3
         if links is None:
@@ -142,26 +237,180 @@ def get_url_category(models: Dict[str,
         elif len(links) < 3:
             links += [None] * (3 - len(links))
 
-        code_url, dataset_url, model_url = links[0], links[1], links[2]
+        model_url = links[2]
 
         # Category: for Phase 1 we primarily tag MODEL rows
-        categories[key] = "MODEL" if _valid_model_url(
-            model_url) or (model_url and model_url.strip()) else None
-
-        # Fill missing links using Purdue GenAI Studio (LLM usage)
-        if not _valid_code_url(code_url) and model_url:
-            filled = get_code_url_from_genai(model_url)
-            if filled:
-                links[0] = filled
-        if not _valid_dataset_url(dataset_url) and model_url:
-            filled = get_dataset_url_from_genai(model_url)
-            if filled:
-                links[1] = filled
+        categories[key] = "MODEL" if model_url and model_url.strip() else None
+        if model_url:
+            queue_fill(links)
+
+    # GenAI lookups are network bound and independent per row; overlap them.
+    if to_fill:
+        with ThreadPoolExecutor(
+                max_workers=min(GENAI_FILL_WORKERS, len(to_fill))) as ex:
+            list(ex.map(_fill_missing_links, to_fill))
     return categories
 
 
+# ---------- result cache ----------
+
+# Opt-in memoization of per-row NDJSON (METRIC_CACHE=1). Metrics are a pure
+# function of the row's URLs, so repeated rows within a run are served from
+# memory and, across runs, from JSON files under METRIC_CACHE_DIR.
+METRIC_CACHE_DIR = ".metric_cache"
+# On-disk entries older than this are recomputed so upstream metadata
+# changes (downloads, likes, licenses) are eventually picked up.
+METRIC_CACHE_TTL = 24 * 3600
+
+
+def _metric_cache_enabled() -> bool:
+    return os.getenv("METRIC_CACHE") == "1"
+
+
+def _metric_cache_path(urls: UrlCtx, category: Optional[str]) -> str:
+    key = "\n".join(v or "" for v in (*urls, category))
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+    return os.path.join(METRIC_CACHE_DIR, f"{digest}.json")
+
+
+@lru_cache(maxsize=1024)
+def _handle_row_cached(urls: UrlCtx, category: Optional[str]) -> str:
+    """Serialized NDJSON for one row, backed by the on-disk cache."""
+    path = _metric_cache_path(urls, category)
+    try:
+        if time.time() - os.path.getmtime(path) < METRIC_CACHE_TTL:
+            with open(path, "r", encoding="utf-8") as f:
+                cached = f.read()
+            json.loads(cached)  # a truncated or corrupt entry is a miss
+            return cached
+    except (OSError, ValueError):
+        pass
+
+    payload = json.dumps(_handle_row(urls, category))
+    tmp = None
+    try:
+        os.makedirs(METRIC_CACHE_DIR, exist_ok=True)
+        # write beside the target and swap it in, so readers never see a
+        # partial file if the run is killed or another process races us
+        fd, tmp = tempfile.mkstemp(dir=METRIC_CACHE_DIR, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(payload)
+        os.replace(tmp, path)
+    except OSError as e:
+        logger.warning(f"Could not write metric cache {path}: {e}")
+        if tmp is not None:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+    return payload
+
+
+def _log_cache_stats() -> None:
+    """Log hit/miss counts of the in-process caches to help tune maxsize."""
+    caches = [("metric row", _handle_row_cached)]
+    utils = sys.modules.get("src.metrics.data_fetcher.utils")
+    if utils is not None:
+        caches.append(("url parts", utils._host_and_parts))
+    for name, cached in caches:
+        info = cached.cache_info()
+        lookups = info.hits + info.misses
+        if not lookups:
+            continue
+        logger.info(f"{name} cache: {info}")
+        # Cold misses are expected; a full cache that keeps missing is churn
+        if info.maxsize and info.currsize >= info.maxsize and info.misses / lookups > 0.5:
+            logger.warning(
+                f"{name} cache is full with a {info.misses / lookups:.0%} miss rate; "
+                f"consider raising maxsize ({info.maxsize})")
+
+
+atexit.register(_log_cache_stats)
+
+
 # ---------- main entry ----------
 
+# Metric id -> latency key reported by the data fetcher for its inputs
+_METRIC_LATENCY_KEYS = {
+    "ramp_up_time": "hf_model_latency",
+    # "bus_factor": "github_latency",
+    "performance_claims": "hf_model_latency",
+    # "license_compliance": "github_latency",
+    "size": "hf_model_latency",
+    "availability": "availability_latency",
+    "dataset_quality": "hf_dataset_latency",
+    "code_quality": "github_latency",
+}
+
+# NDJSON field -> metric id for the scalar metrics (each also has <field>_latency)
+_METRIC_FIELDS = (
+    ("ramp_up_time", "ramp_up_time"),
+    ("bus_factor", "bus_factor"),
+    ("performance_claims", "performance_claims"),
+    ("license", "license_compliance"),
+    ("dataset_and_code_score", "availability"),
+    ("dataset_quality", "dataset_quality"),
+    ("code_quality", "code_quality"),
+)
+
+# Hardware targets reported in the size metric's size_score
+_SIZE_DEVICES = ("raspberry_pi", "jetson_nano", "desktop_pc", "aws_server")
+
+
+def _metric_value(metric, default=None):
+    return metric.value if metric is not None else default
+
+
+def _metric_latency_ms(metric_id: str, metric, latencies: Dict[str, float]):
+    latency_key = _METRIC_LATENCY_KEYS.get(metric_id)
+    if latency_key:
+        seconds = latencies.get(latency_key)
+        return int(seconds * 1000) if seconds is not None else None
+    # Metrics without a fetch latency report their own compute time
+    return metric.seconds * 1000 if metric is not None else None
+
+
+def _handle_row(urls: UrlCtx, category: Optional[str]) -> dict:
+    """Fetch context, run metrics and build the NDJSON object for one row."""
+    from src.metrics.data_fetcher import fetch_comprehensive_metrics_data
+    from src.metrics.ops_plan import default_ops
+    from src.metrics.runner import run_metrics
+
+    if not any(u and u.strip() for u in urls):
+        # Nothing to fetch or score (e.g. a blank input line): defaults only
+        return default_ndjson(model=urls.model_url or "", category=category)
+
+    # Fetch comprehensive context (HF API + GitHub + heuristics)
+    comprehensive = fetch_comprehensive_metrics_data(
+        code_url=urls.code_url or "",
+        dataset_url=urls.dataset_url or "",
+        model_url=urls.model_url or "",
+    )
+    context = {**urls._asdict(), **comprehensive}
+
+    results, summary, latencies = run_metrics(default_ops, context=context)
+
+    size_metric = results.get("size")
+    # Absent or non-dict details/score fall back to {} (all devices None)
+    details = getattr(size_metric, "details", None)
+    size_score = details.get("size_score") if isinstance(details, dict) else None
+    if not isinstance(size_score, dict):
+        size_score = {}
+
+    ndjson_args = {
+        "net_score": float(summary.get("net_score", 0.0)),
+        "net_score_latency": int(summary.get("net_score_latency", 0) or 0),
+        "size_score_latency": _metric_latency_ms("size", size_metric, latencies),
+        **{device: size_score.get(device) for device in _SIZE_DEVICES},
+    }
+    for field, metric_id in _METRIC_FIELDS:
+        metric = results.get(metric_id)
+        ndjson_args[field] = _metric_value(metric)
+        ndjson_args[f"{field}_latency"] = _metric_latency_ms(metric_id, metric, latencies)
+
+    return default_ndjson(model=urls.model_url, category=category, **ndjson_args)
+
+
 def handle_url(models: Dict[str, List[Optional[str]]]) -> Dict[str, dict]:
     """
     Compute metrics and map to NDJSON for each input row.
@@ -169,81 +418,19 @@ def handle_url(models: Dict[str, List[Optional[str]]]) -> Dict[str, dict]:
     Returns a dict keyed by the same ids as `models`.
     """
     categories = get_url_category(models)
-    ndjsons: Dict[str, dict] = {}
-
-    for key, links in models.items():
-        code_url, dataset_url, model_url = links[0], links[1], links[2]
-
-        # Fetch comprehensive context (HF API + GitHub + heuristics)
-        comprehensive = fetch_comprehensive_metrics_data(
-            code_url=code_url or "",
-            dataset_url=dataset_url or "",
-            model_url=model_url or "",
-        )
-        context = {
-            "code_url": code_url,
-            "dataset_url": dataset_url,
-            "model_url": model_url,
-            **comprehensive,
-        }
-
-        metric_latency_map = {
-            "ramp_up_time": "hf_model_latency",
-            # "bus_factor": "github_latency",
-            "performance_claims": "hf_model_latency",
-            # "license_compliance": "github_latency",
-            "size": "hf_model_latency",
-            "availability": "availability_latency",
-            "dataset_quality": "hf_dataset_latency",
-            "code_quality": "github_latency",
-        }
-
-        results, summary, latencies = run_metrics(default_ops, context=context)
-
-        # helpers for mapping
-        def get_metric(metric_id: str, default=None):
-            m = results.get(metric_id)
-            return m.value if m is not None else default
-
-        def get_latency(metric_id: str) -> Optional[int]:
-            latency_key = metric_latency_map.get(metric_id)
-            m = latencies.get(latency_key) if latency_key else None
-            return int(m * 1000) if m is not None else None
-
-        size_metric = results.get("size")
-        size_score = size_metric.details.get(
-            "size_score") if size_metric and hasattr(size_metric, "details") else None
-        license_metric = results.get("license_compliance")
-        license_seconds = license_metric.seconds * 1000 if license_metric else None
-        bus_factor_metric = results.get("bus_factor")
-        bus_factor_seconds = bus_factor_metric.seconds * 1000 if bus_factor_metric else None
-        ndjson_args = {
-            # summary
-            "net_score": float(summary.get("net_score", 0.0)),
-            "net_score_latency": int(summary.get("net_score_latency", 0) or 0),
-            # individual metrics
-            "ramp_up_time": get_metric("ramp_up_time"),
-            "ramp_up_time_latency": get_latency("ramp_up_time"),
-            "bus_factor": get_metric("bus_factor"),
-            "bus_factor_latency": bus_factor_seconds,
-            "performance_claims": get_metric("performance_claims"),
-            "performance_claims_latency": get_latency("performance_claims"),
-            "license": get_metric("license_compliance"),
-            "license_latency": license_seconds,
-            "raspberry_pi": size_score.get("raspberry_pi") if isinstance(size_score, dict) else None,
-            "jetson_nano": size_score.get("jetson_nano") if isinstance(size_score, dict) else None,
-            "desktop_pc": size_score.get("desktop_pc") if isinstance(size_score, dict) else None,
-            "aws_server": size_score.get("aws_server") if isinstance(size_score, dict) else None,
-            "size_score_latency": get_latency("size"),
-            "dataset_and_code_score": get_metric("availability"),
-            "dataset_and_code_score_latency": get_latency("availability"),
-            "dataset_quality": get_metric("dataset_quality"),
-            "dataset_quality_latency": get_latency("dataset_quality"),
-            "code_quality": get_metric("code_quality"),
-            "code_quality_latency": get_latency("code_quality"),
-        }
-
-        ndjsons[key] = default_ndjson(
-            model=model_url, category=categories.get(key), **ndjson_args)
-
-    return ndjsons
+    if not models:
+        return {}
+    use_cache = _metric_cache_enabled()
+
+    def _process_one(key: str) -> dict:
+        urls = UrlCtx(*models[key][:3])
+        category = categories.get(key)
+        if use_cache:
+            return json.loads(_handle_row_cached(urls, category))
+        return _handle_row(urls, category)
+
+    # Rows are independent and dominated by network latency; overlap them.
+    with ThreadPoolExecutor(max_workers=min(ROW_WORKERS, len(models))) as ex:
+        futures = {key: ex.submit(_process_one, key) for key in models}
+        # Preserve input order in the returned mapping
+        return {key: fut.result() for key, fut in futures.items()}
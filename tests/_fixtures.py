@@ -0,0 +1,26 @@
+"""
+Lightweight stand-ins for metric results used by the handle_url tests.
+
+handle_url only reads .value, .seconds and .details, so plain frozen
+dataclasses are enough and avoid building a Mock per metric.
+"""
+from dataclasses import dataclass
+from typing import Any, Dict
+
+
+@dataclass(frozen=True, slots=True)
+class MetricStub:
+    value: float
+    seconds: float
+
+
+@dataclass(frozen=True, slots=True)
+class SizeMetricStub:
+    details: Dict[str, Any]
+    seconds: float
+
+
+@dataclass(frozen=True, slots=True)
+class TimingOnlyStub:
+    """A result that carries no value or details, only its timing."""
+    seconds: float
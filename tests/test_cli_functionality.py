@@ -7,13 +7,8 @@ from src.cli.main import main, parse_args, _check_env_variables
 import pytest
 import sys
 import os
-import tempfile
+from contextlib import nullcontext
 from unittest.mock import Mock, patch, mock_open, MagicMock
-from io import StringIO
-
-# Add src to path
-sys.path.insert(0, os.path.join(
-    os.path.dirname(os.path.dirname(__file__)), 'src'))
 
 
 class TestArgumentParsing:
@@ -37,108 +32,65 @@ class TestArgumentParsing:
 class TestEnvironmentValidation:
     """Test environment variable validation."""
 
-    @patch.dict(os.environ, {"GITHUB_TOKEN": "ghp_test_token"})
-    def test_check_env_variables_valid_github_token(self):
-        """Test environment check with valid GitHub token."""
-        # Should not raise an exception
-        _check_env_variables()
-
-    @patch.dict(os.environ, {"GITHUB_TOKEN": "github_pat_test_token"})
-    def test_check_env_variables_valid_pat_token(self):
-        """Test environment check with valid PAT token."""
-        # Should not raise an exception
-        _check_env_variables()
-
-    @patch.dict(os.environ, {}, clear=True)
-    def test_check_env_variables_missing_token(self):
-        """Test environment check with missing GitHub token."""
-        with pytest.raises(SystemExit):
-            _check_env_variables()
-
-    @patch.dict(os.environ, {"GITHUB_TOKEN": "invalid_token"})
-    def test_check_env_variables_invalid_token(self):
-        """Test environment check with invalid token format."""
-        with pytest.raises(SystemExit):
+    @pytest.mark.parametrize("env,should_exit", [
+        ({"GITHUB_TOKEN": "ghp_test_token"}, False),
+        ({"GITHUB_TOKEN": "github_pat_test_token"}, False),
+        ({}, True),
+        ({"GITHUB_TOKEN": "invalid_token"}, True),
+        ({"GITHUB_TOKEN": "ghp_test", "LOG_LEVEL": "-1"}, True),
+        ({"GITHUB_TOKEN": "ghp_test", "LOG_LEVEL": "3"}, True),
+        ({"GITHUB_TOKEN": "ghp_test", "LOG_LEVEL": "1"}, False),
+    ], ids=[
+        "valid_github_token", "valid_pat_token", "missing_token", "invalid_token",
+        "invalid_log_level", "invalid_high_log_level", "valid_log_level",
+    ])
+    def test_check_env_variables(self, env, should_exit):
+        """Test environment check across token and log level combinations."""
+        expectation = pytest.raises(SystemExit) if should_exit else nullcontext()
+        with patch.dict(os.environ, env, clear=True), expectation:
             _check_env_variables()
 
-    @patch.dict(os.environ, {"GITHUB_TOKEN": "ghp_test", "LOG_LEVEL": "-1"})
-    def test_check_env_variables_invalid_log_level(self):
-        """Test environment check with invalid log level."""
-        with pytest.raises(SystemExit):
-            _check_env_variables()
-
-    @patch.dict(os.environ, {"GITHUB_TOKEN": "ghp_test", "LOG_LEVEL": "3"})
-    def test_check_env_variables_invalid_high_log_level(self):
-        """Test environment check with too high log level."""
-        with pytest.raises(SystemExit):
-            _check_env_variables()
-
-    @patch.dict(os.environ, {"GITHUB_TOKEN": "ghp_test", "LOG_LEVEL": "1"})
-    def test_check_env_variables_valid_log_level(self):
-        """Test environment check with valid log level."""
-        # Should not raise an exception
-        _check_env_variables()
-
 
 class TestMainFunction:
     """Test the main function integration."""
 
-    @patch('src.cli.main._check_env_variables')
-    @patch('src.cli.main.handle_url')
-    @patch('src.cli.main.get_url_category')
-    @patch('sys.stdout', new_callable=StringIO)
-    def test_main_function_basic(self, mock_stdout, mock_category, mock_handle, mock_check_env):
+    def test_main_function_basic(self, monkeypatch, capsys, bert_input_file):
         """Test main function basic execution."""
         # Mock environment check to pass
-        mock_check_env.return_value = None
+        mock_check_env = Mock(return_value=None)
+        monkeypatch.setattr('src.cli.main._check_env_variables', mock_check_env)
 
         # Mock URL processing
-        mock_category.return_value = {"test": "MODEL"}
-        mock_handle.return_value = {
+        monkeypatch.setattr('src.cli.main.get_url_category',
+                            Mock(return_value={"test": "MODEL"}))
+        monkeypatch.setattr('src.cli.main.handle_url', Mock(return_value={
             "test": {
                 "name": "test",
                 "net_score": 0.75
             }
-        }
+        }))
+        monkeypatch.setattr(sys, 'argv', ['main.py', bert_input_file])
 
-        # Create a temporary input file
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.txt') as f:
-            f.write("https://huggingface.co/bert-base-uncased")
-            temp_filename = f.name
+        result = main()
 
-        try:
-            with patch('sys.argv', ['main.py', temp_filename]):
-                result = main()
+        # Should complete successfully
+        assert result is None or result == 0
+        assert capsys.readouterr().out
 
-            # Should complete successfully
-            assert result is None or result == 0
+        # Should have called the expected functions
+        mock_check_env.assert_called_once()
 
-            # Should have called the expected functions
-            mock_check_env.assert_called_once()
-
-        finally:
-            os.unlink(temp_filename)
-
-    @patch('src.cli.main._check_env_variables')
-    @patch('sys.stdout', new_callable=StringIO)
-    def test_main_function_env_failure(self, mock_stdout, mock_check_env):
+    def test_main_function_env_failure(self, monkeypatch, capsys, bert_input_file):
         """Test main function with environment check failure."""
         # Mock environment check to fail
-        mock_check_env.side_effect = SystemExit(1)
+        mock_check_env = Mock(side_effect=SystemExit(1))
+        monkeypatch.setattr('src.cli.main._check_env_variables', mock_check_env)
+        monkeypatch.setattr(sys, 'argv', ['main.py', bert_input_file])
 
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.txt') as f:
-            f.write("https://huggingface.co/bert-base-uncased")
-            temp_filename = f.name
-
-        try:
-            with patch('sys.argv', ['main.py', temp_filename]):
-                with pytest.raises(SystemExit):
-                    main()
-
-            mock_check_env.assert_called_once()
+        with pytest.raises(SystemExit):
+            main()
 
-        finally:
-            os.unlink(temp_filename)
+        mock_check_env.assert_called_once()
 
 
 class TestCLIIntegration:
@@ -199,34 +151,26 @@ class TestCLIErrorHandling:
 class TestCLICompatibility:
     """Test CLI compatibility and expected behavior."""
 
-    def test_main_function_exists(self):
-        """Test that main function exists and is callable."""
-        assert callable(main)
-
-    def test_parse_args_function_exists(self):
-        """Test that parse_args function exists and is callable."""
-        assert callable(parse_args)
-
-    def test_check_env_variables_exists(self):
-        """Test that _check_env_variables function exists and is callable."""
-        assert callable(_check_env_variables)
+    def test_public_api_is_callable(self):
+        """Test that main, parse_args and _check_env_variables are callable."""
+        for func in (main, parse_args, _check_env_variables):
+            assert callable(func), func
 
     @patch('src.cli.main._check_env_variables')
     @patch('src.cli.main.handle_url')
     @patch('src.cli.main.get_url_category')
-    def test_main_function_signature(self, mock_category, mock_handle, mock_check_env):
+    def test_main_function_signature(self, mock_category, mock_handle, mock_check_env, tmp_path):
         """Test that main function has expected signature."""
         # Should be callable without arguments
         mock_check_env.return_value = None
         mock_category.return_value = {}
         mock_handle.return_value = {}
 
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.txt') as f:
-            f.write("https://example.com")
-            temp_filename = f.name
+        input_file = tmp_path / "in.txt"
+        input_file.write_text("https://example.com")
 
         try:
-            with patch('sys.argv', ['main.py', temp_filename]):
+            with patch('sys.argv', ['main.py', str(input_file)]):
                 result = main()
 
             # Should return None or 0 for success
@@ -237,9 +181,6 @@ class TestCLICompatibility:
             # not due to function signature issues
             assert not isinstance(e, TypeError)
 
-        finally:
-            os.unlink(temp_filename)
-
 
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -4,43 +4,55 @@ Test suite summary and coverage verification.
 This module provides utilities to verify test coverage across
 all components and ensure comprehensive testing.
 """
+import copy
 import os
 import sys
-from pathlib import Path
+from functools import lru_cache
 
 
-def get_test_coverage_summary():
-    """Generate a summary of test coverage across all modules."""
-
-    # Define all modules that should have tests
-    required_modules = {
-        'data_fetcher': 'src/metrics/data_fetcher',
-        'url_type_handler': 'src/url_parsers/url_type_handler.py',
-        'cli_main': 'src/cli/main.py',
-        'metrics_implementations': 'src/metrics/impl/*.py',
-        'metrics_runner_schema': 'src/metrics/runner.py'
-    }
+# Modules that should have tests
+REQUIRED_MODULES = {
+    'data_fetcher': 'src/metrics/data_fetcher',
+    'url_type_handler': 'src/url_parsers/url_type_handler.py',
+    'cli_main': 'src/cli/main.py',
+    'metrics_implementations': 'src/metrics/impl/*.py',
+    'metrics_runner_schema': 'src/metrics/runner.py'
+}
 
-    # Define existing test files
-    test_files = {
-        'data_fetcher': 'tests/test_data_fetcher.py',
-        'url_type_handler': 'tests/test_url_type_handler.py',
-        'cli_main': 'tests/test_cli_main.py',
-        'metrics_implementations': 'tests/test_metrics_implementations.py',
-        'metrics_runner_schema': 'tests/test_metrics_runner_schema.py'
-    }
+# Existing test files
+TEST_FILES = {
+    'data_fetcher': 'tests/test_data_fetcher.py',
+    'url_type_handler': 'tests/test_url_type_handler.py',
+    'cli_main': 'tests/test_cli_main.py',
+    'metrics_implementations': 'tests/test_metrics_implementations.py',
+    'metrics_runner_schema': 'tests/test_metrics_runner_schema.py'
+}
+
+
+def _present_test_files(test_dir="tests"):
+    """Names of the regular files in test_dir, read with one directory scan."""
+    try:
+        with os.scandir(test_dir) as entries:
+            return {e.name for e in entries if e.is_file()}
+    except OSError:
+        return set()
+
+
+@lru_cache(maxsize=1)
+def _compute_coverage_summary():
+    present = _present_test_files()
 
     coverage_summary = {
-        'total_modules': len(required_modules),
+        'total_modules': len(REQUIRED_MODULES),
         'tested_modules': 0,
         'coverage_details': {}
     }
 
     # Check each module
-    for module_name, module_path in required_modules.items():
-        test_file = test_files.get(module_name)
+    for module_name, module_path in REQUIRED_MODULES.items():
+        test_file = TEST_FILES.get(module_name)
 
-        if test_file and os.path.exists(test_file):
+        if test_file and test_file.rsplit('/', 1)[-1] in present:
             coverage_summary['tested_modules'] += 1
             coverage_summary['coverage_details'][module_name] = {
                 'module_path': module_path,
@@ -57,51 +69,68 @@ def get_test_coverage_summary():
     return coverage_summary
 
 
-def print_coverage_report():
-    """Print a detailed coverage report."""
-    summary = get_test_coverage_summary()
+def get_test_coverage_summary():
+    """Generate a summary of test coverage across all modules.
+
+    The filesystem checks run once; callers get their own copy to mutate.
+    """
+    return copy.deepcopy(_compute_coverage_summary())
 
-    print("=" * 80)
-    print("COMPREHENSIVE TEST COVERAGE REPORT")
-    print("=" * 80)
+
+def print_coverage_report(verbose=None):
+    """Print a detailed coverage report.
+
+    Only the summary is returned when not verbose (default: stdout is a TTY).
+    """
+    summary = get_test_coverage_summary()
+    if verbose is None:
+        verbose = sys.stdout.isatty()
+    if not verbose:
+        return summary
 
     coverage_percentage = (
         summary['tested_modules'] / summary['total_modules']) * 100
 
-    print(
-        f"Overall Coverage: {summary['tested_modules']}/{summary['total_modules']} modules ({coverage_percentage:.1f}%)")
-    print()
-
-    print("Module Coverage Details:")
-    print("-" * 40)
+    lines = [
+        "=" * 80,
+        "COMPREHENSIVE TEST COVERAGE REPORT",
+        "=" * 80,
+        f"Overall Coverage: {summary['tested_modules']}/{summary['total_modules']} modules ({coverage_percentage:.1f}%)",
+        "",
+        "Module Coverage Details:",
+        "-" * 40,
+    ]
 
     for module_name, details in summary['coverage_details'].items():
         status_indicator = "✓" if details['status'] == 'COVERED' else "✗"
-        print(f"{status_indicator} {module_name:<25} {details['status']}")
-        print(f"  Module: {details['module_path']}")
-        print(f"  Test:   {details['test_file']}")
-        print()
+        lines += [
+            f"{status_indicator} {module_name:<25} {details['status']}",
+            f"  Module: {details['module_path']}",
+            f"  Test:   {details['test_file']}",
+            "",
+        ]
 
-    print("=" * 80)
+    lines.append("=" * 80)
 
     if coverage_percentage == 100:
-        print("🎉 EXCELLENT! Full test coverage achieved!")
-        print("All critical modules have comprehensive test suites.")
+        lines += ["🎉 EXCELLENT! Full test coverage achieved!",
+                  "All critical modules have comprehensive test suites."]
     elif coverage_percentage >= 80:
-        print("✅ GOOD! High test coverage achieved.")
-        print("Most modules are well tested.")
+        lines += ["✅ GOOD! High test coverage achieved.",
+                  "Most modules are well tested."]
     else:
-        print("⚠️  WARNING! Low test coverage.")
-        print("Consider adding more tests for better reliability.")
+        lines += ["⚠️  WARNING! Low test coverage.",
+                  "Consider adding more tests for better reliability."]
 
+    sys.stdout.write("\n".join(lines) + "\n")
     return summary
 
 
 def verify_test_files_exist():
     """Verify that all test files exist and are accessible."""
-    test_directory = Path("tests")
+    test_directory = "tests"
 
-    if not test_directory.exists():
+    if not os.path.isdir(test_directory):
         print("❌ Tests directory not found!")
         return False
 
@@ -113,15 +142,9 @@ def verify_test_files_exist():
         "test_metrics_runner_schema.py"
     ]
 
-    missing_files = []
-    existing_files = []
-
-    for test_file in expected_test_files:
-        file_path = test_directory / test_file
-        if file_path.exists():
-            existing_files.append(test_file)
-        else:
-            missing_files.append(test_file)
+    present = _present_test_files(test_directory)
+    existing_files = [f for f in expected_test_files if f in present]
+    missing_files = [f for f in expected_test_files if f not in present]
 
     print(f"✅ Found {len(existing_files)} test files:")
     for file in existing_files:
@@ -144,7 +167,7 @@ if __name__ == "__main__":
     if verify_test_files_exist():
         print()
         # Generate coverage report
-        summary = print_coverage_report()
+        summary = print_coverage_report(verbose=True)
 
         # Exit with appropriate code
         if summary['tested_modules'] == summary['total_modules']:
@@ -5,20 +5,27 @@ Tests cover API integration, data processing, error handling,
 and performance claims analysis with mocked external dependencies.
 """
 from src.metrics.data_fetcher import (
-    safe_request, extract_repo_info, extract_hf_model_id, check_availability,
+    safe_request, extract_repo_info, extract_hf_model_id, check_availability, classify_url,
     get_huggingface_model_data, get_huggingface_dataset_data, get_github_repo_data,
     analyze_code_quality, normalize_downloads, normalize_stars, compute_size_scores,
     analyze_performance_claims, fetch_comprehensive_metrics_data
 )
 import pytest
-import sys
-import os
+from types import MappingProxyType, SimpleNamespace
 from unittest.mock import Mock, patch, MagicMock
 from typing import Dict, Any, List
 
-# Add src to path
-sys.path.insert(0, os.path.join(
-    os.path.dirname(os.path.dirname(__file__)), 'src'))
+
+# compute_size_scores floor for unknown/zero-size models
+ZERO_SIZE_SCORES = MappingProxyType({
+    "raspberry_pi": 0.01, "jetson_nano": 0.01,
+    "desktop_pc": 0.01, "aws_server": 0.01})
+
+AVAILABILITY_URLS = (
+    "https://github.com/owner/repo",
+    "https://huggingface.co/datasets/data",
+    "https://huggingface.co/model",
+)
 
 
 class TestUtilityFunctions:
@@ -30,6 +37,8 @@ class TestUtilityFunctions:
             "https://github.com/owner/repo") == ("owner", "repo")
         assert extract_repo_info(
             "https://github.com/facebook/react/") == ("facebook", "react")
+        assert extract_repo_info(
+            "HTTPS://github.com/owner/repo") == ("owner", "repo")
 
     def test_extract_repo_info_invalid_url(self):
         """Test extracting info from invalid URLs."""
@@ -55,63 +64,74 @@ class TestUtilityFunctions:
         assert extract_hf_model_id("https://github.com/owner/repo") is None
         assert extract_hf_model_id("not-a-url") is None
 
-    @patch('requests.get')
-    def test_safe_request_success(self, mock_get):
+    def test_classify_url(self):
+        """Test host-based URL classification."""
+        assert classify_url("https://huggingface.co/gpt2") == "hf_model"
+        assert classify_url(
+            "https://huggingface.co/facebook/bart-base") == "hf_model"
+        assert classify_url(
+            "https://www.huggingface.co/datasets/squad") == "hf_dataset"
+        assert classify_url(
+            "https://huggingface.co/spaces/owner/space") == "hf_space"
+        assert classify_url("https://GitHub.com/owner/repo") == "github_repo"
+        assert classify_url("HTTPS://github.com/owner/repo") == "github_repo"
+        assert classify_url("Http://huggingface.co/gpt2") == "hf_model"
+        assert classify_url("https://gitlab.com/owner/repo") == "gitlab_repo"
+        assert classify_url("https://huggingface.co/") == "unknown"
+        assert classify_url("https://example.com/x") == "unknown"
+        assert classify_url("") == "unknown"
+
+    def test_classify_url_rejects_unsupported_hosts(self):
+        """Subdomains and short hosts the extractors can't parse are unknown."""
+        assert classify_url("https://gist.github.com/owner/abc123") == "unknown"
+        assert classify_url("https://api.github.com/repos/o/r") == "unknown"
+        assert classify_url("https://hf.co/gpt2") == "unknown"
+        assert extract_hf_model_id("https://hf.co/gpt2") is None
+
+    @patch('src.http_client._SESSION')
+    def test_safe_request_success(self, mock_session):
         """Test successful HTTP request."""
         mock_response = Mock()
         mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
+        mock_session.get.return_value = mock_response
 
         result = safe_request("https://example.com")
         assert result == mock_response
-        mock_get.assert_called_once_with("https://example.com", timeout=10)
+        mock_session.get.assert_called_once_with(
+            "https://example.com", timeout=10)
 
-    @patch('requests.get')
-    def test_safe_request_failure(self, mock_get):
+    @patch('src.http_client._SESSION')
+    def test_safe_request_failure(self, mock_session):
         """Test failed HTTP request."""
-        mock_get.side_effect = Exception("Network error")
+        mock_session.get.side_effect = Exception("Network error")
 
         result = safe_request("https://example.com")
         assert result is None
 
-    @patch('requests.head')
-    def test_check_availability_all_available(self, mock_head):
+    @patch('src.http_client._SESSION')
+    def test_check_availability_all_available(self, mock_session):
         """Test URL availability check when all URLs are available."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_head.return_value = mock_response
+        mock_session.head.return_value = Mock(status_code=200)
 
-        result = check_availability(
-            "https://github.com/owner/repo",
-            "https://huggingface.co/datasets/data",
-            "https://huggingface.co/model"
-        )
+        result = check_availability(*AVAILABILITY_URLS)
 
         assert result["has_code"] is True
         assert result["has_dataset"] is True
         assert result["has_model"] is True
         assert result["links_ok"] is True
+        assert mock_session.head.call_count == 3
+        mock_session.head.assert_any_call(
+            AVAILABILITY_URLS[0], timeout=10, allow_redirects=True)
 
-    @patch('requests.head')
-    def test_check_availability_some_unavailable(self, mock_head):
+    @patch('src.http_client._SESSION')
+    def test_check_availability_some_unavailable(self, mock_session):
         """Test URL availability check when some URLs are unavailable."""
-        def side_effect(url, **kwargs):
-            if "github.com" in url:
-                response = Mock()
-                response.status_code = 200
-                return response
-            else:
-                response = Mock()
-                response.status_code = 404
-                return response
-
-        mock_head.side_effect = side_effect
-
-        result = check_availability(
-            "https://github.com/owner/repo",
-            "https://huggingface.co/datasets/data",
-            "https://huggingface.co/model"
-        )
+        code_url, dataset_url, model_url = AVAILABILITY_URLS
+        statuses = {code_url: 200, dataset_url: 404, model_url: 404}
+        mock_session.head.side_effect = (
+            lambda url, **kwargs: Mock(status_code=statuses[url]))
+
+        result = check_availability(*AVAILABILITY_URLS)
 
         assert result["has_code"] is True
         assert result["has_dataset"] is False
@@ -122,33 +142,34 @@ class TestUtilityFunctions:
 class TestNormalizationFunctions:
     """Test normalization and scoring functions."""
 
-    def test_normalize_downloads(self):
+    @pytest.mark.parametrize("downloads,expected", [
+        (0, 0.0),
+        (-1, 0.0),
+        (1, 0.0),             # log10(1) = 0
+        (1000, 0.5),          # log10(1000)/6 = 3/6 = 0.5
+        (1000000, 1.0),       # log10(1e6)/6 = 6/6 = 1.0
+        (10000000, 1.0),      # Capped at 1.0
+    ])
+    def test_normalize_downloads(self, downloads, expected):
         """Test download count normalization."""
-        assert normalize_downloads(0) == 0.0
-        assert normalize_downloads(-1) == 0.0
-        assert normalize_downloads(1) == 0.0  # log10(1) = 0
-        assert normalize_downloads(1000) == 0.5  # log10(1000)/6 = 3/6 = 0.5
-        assert normalize_downloads(1000000) == 1.0  # log10(1e6)/6 = 6/6 = 1.0
-        assert normalize_downloads(10000000) == 1.0  # Capped at 1.0
-
-    def test_normalize_stars(self):
+        assert normalize_downloads(downloads) == expected
+
+    @pytest.mark.parametrize("stars,expected", [
+        (0, 0.0),
+        (-1, 0.0),
+        (1, 0.0),             # log10(1) = 0
+        (100, 0.5),           # log10(100)/4 = 2/4 = 0.5
+        (10000, 1.0),         # log10(1e4)/4 = 4/4 = 1.0
+        (100000, 1.0),        # Capped at 1.0
+    ])
+    def test_normalize_stars(self, stars, expected):
         """Test star count normalization."""
-        assert normalize_stars(0) == 0.0
-        assert normalize_stars(-1) == 0.0
-        assert normalize_stars(1) == 0.0  # log10(1) = 0
-        assert normalize_stars(100) == 0.5  # log10(100)/4 = 2/4 = 0.5
-        assert normalize_stars(10000) == 1.0  # log10(1e4)/4 = 4/4 = 1.0
-        assert normalize_stars(100000) == 1.0  # Capped at 1.0
-
-    def test_compute_size_scores_zero_size(self):
-        """Test size scoring with zero or negative size."""
-        result = compute_size_scores(0)
-        expected = {"raspberry_pi": 0.01, "jetson_nano": 0.01,
-                    "desktop_pc": 0.01, "aws_server": 0.01}
-        assert result == expected
+        assert normalize_stars(stars) == expected
 
-        result = compute_size_scores(-100)
-        assert result == expected
+    @pytest.mark.parametrize("size", [0, -100])
+    def test_compute_size_scores_zero_size(self, size):
+        """Test size scoring with zero or negative size."""
+        assert compute_size_scores(size) == ZERO_SIZE_SCORES
 
     def test_compute_size_scores_various_sizes(self):
         """Test size scoring with various model sizes."""
@@ -167,6 +188,14 @@ class TestNormalizationFunctions:
         # Well under 100GB threshold (>= to handle precision)
         assert result["aws_server"] >= 0.98
 
+    def test_compute_size_scores_cached_result_is_not_shared(self):
+        """Each caller gets its own dict, even for repeated inputs."""
+        first = compute_size_scores(0)
+        first["raspberry_pi"] = 1.0
+        second = compute_size_scores(0)
+        assert second["raspberry_pi"] == 0.01
+        assert first is not second
+
 
 class TestCodeQualityAnalysis:
     """Test code quality analysis functions."""
@@ -215,28 +244,30 @@ class TestCodeQualityAnalysis:
         assert result["maintainability_norm"] < 1.0
 
 
-class TestPerformanceClaimsAnalysis:
-    """Test enhanced performance claims analysis."""
+@pytest.fixture
+def hf_data_factory():
+    """Build HuggingFace model data with the given fields overridden."""
+    def _make(**kwargs):
+        data = {"card_data": {}, "pipeline_tag": None, "downloads": 0}
+        data.update(kwargs)
+        return data
+    return _make
 
-    def create_mock_hf_data(self, **kwargs):
-        """Create mock HuggingFace model data."""
-        default_data = {
-            "card_data": {},
-            "pipeline_tag": None,
-            "downloads": 0
-        }
-        default_data.update(kwargs)
-        return default_data
 
-    def create_mock_card_data(self, **kwargs):
-        """Create mock card data that behaves like ModelCardData."""
-        mock_card = Mock()
-        mock_card.to_dict.return_value = kwargs
-        return mock_card
+@pytest.fixture
+def card_data_factory():
+    """Build a ModelCardData-like object whose to_dict() returns kwargs."""
+    def _make(**kwargs):
+        return SimpleNamespace(to_dict=lambda: kwargs)
+    return _make
 
-    def test_analyze_performance_claims_minimal(self):
+
+class TestPerformanceClaimsAnalysis:
+    """Test enhanced performance claims analysis."""
+
+    def test_analyze_performance_claims_minimal(self, hf_data_factory):
         """Test performance claims analysis with minimal data."""
-        hf_data = self.create_mock_hf_data()
+        hf_data = hf_data_factory()
         result = analyze_performance_claims(hf_data, [])
 
         assert result["requirements_passed"] == 0
@@ -245,23 +276,24 @@ class TestPerformanceClaimsAnalysis:
         assert not result["details"]["model_index"]
         assert not result["details"]["datasets_mentioned"]
 
-    def test_analyze_performance_claims_with_pipeline_tag(self):
+    def test_analyze_performance_claims_with_pipeline_tag(self, hf_data_factory):
         """Test performance claims analysis with pipeline tag."""
-        hf_data = self.create_mock_hf_data(pipeline_tag="text-generation")
+        hf_data = hf_data_factory(pipeline_tag="text-generation")
         result = analyze_performance_claims(hf_data, [])
 
         assert result["requirements_passed"] == 1  # Only pipeline_tag
         assert result["requirements_score"] > 0.1  # Should get some score
         assert result["details"]["pipeline_tag"] == "text-generation"
 
-    def test_analyze_performance_claims_with_card_data(self):
+    def test_analyze_performance_claims_with_card_data(
+            self, hf_data_factory, card_data_factory):
         """Test performance claims analysis with rich card data."""
-        card_data = self.create_mock_card_data(
+        card_data = card_data_factory(
             datasets=["squad", "glue"],
             metrics=["accuracy", "f1"],
             **{"model-index": [{"name": "test"}]}
         )
-        hf_data = self.create_mock_hf_data(
+        hf_data = hf_data_factory(
             card_data=card_data, pipeline_tag="question-answering")
 
         result = analyze_performance_claims(hf_data, ["README.md"])
@@ -273,9 +305,9 @@ class TestPerformanceClaimsAnalysis:
         assert result["details"]["metrics_metadata"] is True
         assert result["details"]["pipeline_tag"] == "question-answering"
 
-    def test_analyze_performance_claims_with_github_files(self):
+    def test_analyze_performance_claims_with_github_files(self, hf_data_factory):
         """Test performance claims analysis with GitHub files."""
-        hf_data = self.create_mock_hf_data()
+        hf_data = hf_data_factory()
         github_files = [
             "README.md",
             "evaluate.py",
@@ -291,9 +323,9 @@ class TestPerformanceClaimsAnalysis:
         # Should get reasonable score (adjusted for actual calculation)
         assert result["requirements_score"] > 0.18
 
-    def test_analyze_performance_claims_card_data_as_dict(self):
+    def test_analyze_performance_claims_card_data_as_dict(self, hf_data_factory):
         """Test performance claims analysis when card_data is already a dict."""
-        hf_data = self.create_mock_hf_data(
+        hf_data = hf_data_factory(
             card_data={"datasets": ["test"], "metrics": ["accuracy"]}
         )
 
@@ -303,25 +335,53 @@ class TestPerformanceClaimsAnalysis:
         assert result["details"]["metrics_metadata"] is True
 
 
+GITHUB_API = "https://api.github.com/repos/owner/repo"
+GITHUB_PAYLOADS = {
+    GITHUB_API: {
+        "stargazers_count": 1000,
+        "forks_count": 200,
+        "created_at": "2020-01-01T00:00:00Z",
+        "updated_at": "2023-01-01T00:00:00Z",
+        "license": {"spdx_id": "MIT"}
+    },
+    f"{GITHUB_API}/contributors": [
+        {"contributions": 100},
+        {"contributions": 50},
+        {"contributions": 25}
+    ],
+    f"{GITHUB_API}/git/trees/main?recursive=1": {
+        "tree": [
+            {"path": "README.md", "type": "blob"},
+            {"path": "src/main.py", "type": "blob"},
+            {"path": "tests", "type": "tree"}  # Should be ignored
+        ]
+    },
+}
+
+
+@pytest.fixture(scope="module")
+def hf_info_fixture():
+    """Pre-built ``model_info`` result for a small BERT model."""
+    # cardData is a plain dict so .get() works
+    return SimpleNamespace(
+        tags=["pytorch", "bert"],
+        downloads=1_000_000,
+        pipeline_tag="fill-mask",
+        modelId="bert-base-uncased",
+        sha="abc123",
+        cardData={"license": "apache-2.0"},
+    )
+
+
 class TestAPIIntegration:
     """Test API integration functions with mocking."""
 
     @patch('huggingface_hub.model_info')
     @patch('huggingface_hub.HfApi')
-    def test_get_huggingface_model_data_success(self, mock_hf_api, mock_model_info):
+    def test_get_huggingface_model_data_success(
+            self, mock_hf_api, mock_model_info, hf_info_fixture):
         """Test successful HuggingFace model data retrieval."""
-        # Mock model_info
-        mock_info = Mock()
-        mock_info.tags = ["pytorch", "bert"]
-        mock_info.downloads = 1000000
-        mock_info.pipeline_tag = "fill-mask"
-        mock_info.modelId = "bert-base-uncased"
-        mock_info.sha = "abc123"
-
-        # Mock cardData as a dict-like object that supports .get()
-        mock_card_data = {"license": "apache-2.0"}
-        mock_info.cardData = mock_card_data
-        mock_model_info.return_value = mock_info
+        mock_model_info.return_value = hf_info_fixture
 
         # Mock HfApi
         mock_api = Mock()
@@ -329,9 +389,9 @@ class TestAPIIntegration:
             "config.json", "pytorch_model.bin"]
 
         # Mock file info - return list with RepoFile-like objects
-        mock_file_info = Mock()
-        mock_file_info.size = 500000000  # 500MB
-        mock_api.get_paths_info.return_value = [mock_file_info]
+        mock_api.get_paths_info.return_value = [
+            SimpleNamespace(size=500000000),  # 500MB each
+            SimpleNamespace(size=500000000)]
 
         mock_hf_api.return_value = mock_api
 
@@ -342,6 +402,28 @@ class TestAPIIntegration:
         assert result["pipeline_tag"] == "fill-mask"
         assert result["total_size_bytes"] == 1000000000  # 2 files * 500MB each
         assert result["license"] == "apache-2.0"
+        mock_api.get_paths_info.assert_called_once_with(
+            "bert-base-uncased", ["config.json", "pytorch_model.bin"],
+            repo_type="model")
+
+    @patch('huggingface_hub.model_info')
+    @patch('huggingface_hub.HfApi')
+    def test_get_huggingface_model_data_is_memoized(
+            self, mock_hf_api, mock_model_info, hf_info_fixture):
+        """Test repeated lookups of one model hit the Hub only once."""
+        mock_model_info.return_value = hf_info_fixture
+        mock_hf_api.return_value.list_repo_files.return_value = []
+
+        url = "https://huggingface.co/bert-base-uncased"
+        first = get_huggingface_model_data(url)
+        second = get_huggingface_model_data(url)
+
+        assert first == second
+        assert mock_model_info.call_count == 1
+
+        get_huggingface_model_data.cache_clear()
+        get_huggingface_model_data(url)
+        assert mock_model_info.call_count == 2
 
     @patch('huggingface_hub.model_info')
     def test_get_huggingface_model_data_failure(self, mock_model_info):
@@ -352,50 +434,10 @@ class TestAPIIntegration:
             "https://huggingface.co/invalid-model")
         assert result == {}
 
-    @patch('requests.get')
-    def test_get_github_repo_data_success(self, mock_get):
+    def test_get_github_repo_data_success(self, http_registry):
         """Test successful GitHub repository data retrieval."""
-        # Mock repository response
-        repo_data = {
-            "stargazers_count": 1000,
-            "forks_count": 200,
-            "created_at": "2020-01-01T00:00:00Z",
-            "updated_at": "2023-01-01T00:00:00Z",
-            "license": {"spdx_id": "MIT"}
-        }
-
-        # Mock contributors response
-        contributors_data = [
-            {"contributions": 100},
-            {"contributions": 50},
-            {"contributions": 25}
-        ]
-
-        # Mock tree response
-        tree_data = {
-            "tree": [
-                {"path": "README.md", "type": "blob"},
-                {"path": "src/main.py", "type": "blob"},
-                {"path": "tests", "type": "tree"}  # Should be ignored
-            ]
-        }
-
-        def mock_response(*args, **kwargs):
-            url = args[0]
-            response = Mock()
-            response.raise_for_status.return_value = None
-            response.ok = True
-
-            if "/repos/" in url and url.endswith("/repo"):
-                response.json.return_value = repo_data
-            elif "/contributors" in url:
-                response.json.return_value = contributors_data
-            elif "/git/trees/" in url:
-                response.json.return_value = tree_data
-
-            return response
-
-        mock_get.side_effect = mock_response
+        for url, payload in GITHUB_PAYLOADS.items():
+            http_registry.register(url, json=payload)
 
         result = get_github_repo_data("https://github.com/owner/repo")
 
@@ -413,10 +455,22 @@ class TestAPIIntegration:
         assert contributors["top_contributor_pct"] == 100 / \
             175  # Top contributor percentage
 
-    @patch('requests.get')
-    def test_get_github_repo_data_failure(self, mock_get):
+    def test_get_github_repo_data_master_branch_fallback(self, http_registry):
+        """Test the file tree falls back to master when main is missing."""
+        http_registry.register(GITHUB_API, json=GITHUB_PAYLOADS[GITHUB_API])
+        http_registry.register(
+            f"{GITHUB_API}/git/trees/master?recursive=1",
+            json={"tree": [{"path": "setup.py", "type": "blob"}]})
+
+        result = get_github_repo_data("https://github.com/owner/repo")
+
+        assert result["stars"] == 1000
+        assert result["contributors"] == {}
+        assert result["files"] == ["setup.py"]
+
+    def test_get_github_repo_data_failure(self, http_registry):
         """Test GitHub repository data retrieval failure."""
-        mock_get.side_effect = Exception("API error")
+        # Nothing registered: every request raises ConnectionError
 
         result = get_github_repo_data("https://github.com/owner/repo")
 
@@ -426,14 +480,55 @@ class TestAPIIntegration:
         assert result["files"] == []
         assert result["contributors"] == {}
 
+    def test_get_github_repo_data_failure_is_not_cached(self, http_registry):
+        """Test a failed fetch is retried instead of served from the cache."""
+        assert get_github_repo_data("https://github.com/owner/repo")["stars"] == 0
+
+        for url, payload in GITHUB_PAYLOADS.items():
+            http_registry.register(url, json=payload)
+
+        assert get_github_repo_data("https://github.com/owner/repo")["stars"] == 1000
+
+    def test_get_github_repo_data_cache_hits_are_copies(self, http_registry):
+        """Test keyword calls work and mutating a result does not leak."""
+        for url, payload in GITHUB_PAYLOADS.items():
+            http_registry.register(url, json=payload)
+
+        first = get_github_repo_data(code_url="https://github.com/owner/repo")
+        first["stars"] = -1
+        second = get_github_repo_data(code_url="https://github.com/owner/repo")
+
+        assert second["stars"] == 1000
+        assert http_registry.calls.count(("GET", GITHUB_API)) == 1
+
+
+# get_huggingface_model_data / get_github_repo_data results for gpt2 and
+# owner/repo; the aggregator only reads these
+HF_MODEL_PAYLOAD = {
+    "license": "apache-2.0",
+    "downloads": 1000000,
+    "total_size_bytes": 500000000,
+    "pipeline_tag": "text-generation",
+    "card_data": SimpleNamespace(to_dict=lambda: {"datasets": ["squad"]}),
+}
+GH_REPO_PAYLOAD = {
+    "contributors": {"contributors_count": 5, "top_contributor_pct": 0.4},
+    "files": ["README.md", "src/main.py", "tests/test_main.py"],
+    "stars": 1000,
+    "license": "MIT",
+    "updated_at": "2023-01-01T00:00:00Z",
+}
+
 
 class TestComprehensiveFetching:
     """Test the main comprehensive data fetching function."""
 
+    @patch('src.metrics.data_fetcher.get_huggingface_dataset_data')
     @patch('src.metrics.data_fetcher.get_huggingface_model_data')
     @patch('src.metrics.data_fetcher.get_github_repo_data')
     @patch('src.metrics.data_fetcher.check_availability')
-    def test_fetch_comprehensive_metrics_data_success(self, mock_availability, mock_github, mock_hf):
+    def test_fetch_comprehensive_metrics_data_success(self, mock_availability, mock_github, mock_hf,
+                                                      mock_hf_dataset):
         """Test successful comprehensive data fetching."""
         # Mock availability
         mock_availability.return_value = {
@@ -443,25 +538,9 @@ class TestComprehensiveFetching:
             "links_ok": True
         }
 
-        # Mock HuggingFace data
-        mock_hf.return_value = {
-            "license": "apache-2.0",
-            "downloads": 1000000,
-            "total_size_bytes": 500000000,
-            "pipeline_tag": "text-generation",
-            "card_data": Mock()
-        }
-        mock_hf.return_value["card_data"].to_dict.return_value = {
-            "datasets": ["squad"]}
-
-        # Mock GitHub data
-        mock_github.return_value = {
-            "contributors": {"contributors_count": 5, "top_contributor_pct": 0.4},
-            "files": ["README.md", "src/main.py", "tests/test_main.py"],
-            "stars": 1000,
-            "license": "MIT",
-            "updated_at": "2023-01-01T00:00:00Z"
-        }
+        mock_hf.return_value = HF_MODEL_PAYLOAD
+        mock_github.return_value = GH_REPO_PAYLOAD
+        mock_hf_dataset.return_value = {}
 
         result = fetch_comprehensive_metrics_data(
             code_url="https://github.com/owner/repo",
@@ -479,6 +558,8 @@ class TestComprehensiveFetching:
         assert result["requirements_score"] > 0.3
         assert "ramp" in result
         assert result["ramp"]["downloads_norm"] > 0.9  # 1M downloads
+        mock_hf_dataset.assert_called_once_with(
+            "https://huggingface.co/datasets/squad")
 
     @patch('src.metrics.data_fetcher.get_huggingface_model_data')
     def test_fetch_comprehensive_metrics_data_hf_failure(self, mock_hf):
@@ -494,8 +575,7 @@ class TestComprehensiveFetching:
         # Should still return valid structure with defaults
         assert result["requirements_passed"] == 0
         assert result["requirements_total"] == 1
-        assert result["size_components"] == {
-            "raspberry_pi": 0.01, "jetson_nano": 0.01, "desktop_pc": 0.01, "aws_server": 0.01}
+        assert result["size_components"] == ZERO_SIZE_SCORES
 
     def test_fetch_comprehensive_metrics_data_exception_handling(self):
         """Test comprehensive data fetching with exception handling."""
@@ -6,14 +6,6 @@ from src.error_handling import (
     DependencyError, handle_error
 )
 import pytest
-import sys
-import os
-from unittest.mock import patch, MagicMock
-from io import StringIO
-
-# Add src to path
-sys.path.insert(0, os.path.join(
-    os.path.dirname(os.path.dirname(__file__)), 'src'))
 
 
 class TestCustomExceptions:
@@ -47,57 +39,46 @@ class TestCustomExceptions:
         assert isinstance(error, Exception)
 
 
+def _assert_exits(capsys, caplog, args, code, err, logged):
+    """Call handle_error(*args) and check its exit code, stderr and log."""
+    with pytest.raises(SystemExit) as exc_info:
+        handle_error(*args)
+    assert exc_info.value.code == code
+    assert err in capsys.readouterr().err
+    assert [r.getMessage() for r in caplog.records] == [logged]
+
+
 class TestHandleError:
     """Test the handle_error function."""
 
-    @patch('sys.stderr', new_callable=StringIO)
-    @patch('logging.error')
-    def test_handle_error_with_custom_message(self, mock_log, mock_stderr):
+    def test_handle_error_with_custom_message(self, capsys, caplog):
         """Test handle_error with custom message."""
         test_exception = ValueError("Original error")
 
-        with pytest.raises(SystemExit) as exc_info:
-            handle_error(test_exception, "Custom error message", 1)
-
-        assert exc_info.value.code == 1
-        assert "Error: Custom error message" in mock_stderr.getvalue()
-        mock_log.assert_called_once_with("Original error")
+        _assert_exits(capsys, caplog, (test_exception, "Custom error message", 1),
+                      code=1, err="Error: Custom error message",
+                      logged="Original error")
 
-    @patch('sys.stderr', new_callable=StringIO)
-    @patch('logging.error')
-    def test_handle_error_without_custom_message(self, mock_log, mock_stderr):
+    def test_handle_error_without_custom_message(self, capsys, caplog):
         """Test handle_error without custom message."""
         test_exception = ValueError("Test error")
 
-        with pytest.raises(SystemExit) as exc_info:
-            handle_error(test_exception)
+        _assert_exits(capsys, caplog, (test_exception,),
+                      code=1, err="Error: Test error",
+                      logged="Test error")
 
-        assert exc_info.value.code == 1
-        assert "Error: Test error" in mock_stderr.getvalue()
-        mock_log.assert_called_once_with("Test error")
-
-    @patch('sys.stderr', new_callable=StringIO)
-    @patch('logging.error')
-    def test_handle_error_custom_exit_code(self, mock_log, mock_stderr):
+    def test_handle_error_custom_exit_code(self, capsys, caplog):
         """Test handle_error with custom exit code."""
         test_exception = RuntimeError("Runtime error")
 
-        with pytest.raises(SystemExit) as exc_info:
-            handle_error(test_exception, "Custom message", 42)
-
-        assert exc_info.value.code == 42
-        assert "Error: Custom message" in mock_stderr.getvalue()
-        mock_log.assert_called_once_with("Runtime error")
+        _assert_exits(capsys, caplog, (test_exception, "Custom message", 42),
+                      code=42, err="Error: Custom message",
+                      logged="Runtime error")
 
-    @patch('sys.stderr', new_callable=StringIO)
-    @patch('logging.error')
-    def test_handle_error_with_team4hope_error(self, mock_log, mock_stderr):
+    def test_handle_error_with_team4hope_error(self, capsys, caplog):
         """Test handle_error with Team4HopeError."""
         test_exception = InvalidURLError("Bad URL")
 
-        with pytest.raises(SystemExit) as exc_info:
-            handle_error(test_exception, None, 2)
-
-        assert exc_info.value.code == 2
-        assert "Error: Bad URL" in mock_stderr.getvalue()
-        mock_log.assert_called_once_with("Bad URL")
+        _assert_exits(capsys, caplog, (test_exception, None, 2),
+                      code=2, err="Error: Bad URL",
+                      logged="Bad URL")
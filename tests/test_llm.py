@@ -2,28 +2,43 @@
 Tests for LLM data fetcher module.
 """
 import pytest
-import sys
-import os
-from unittest.mock import patch, Mock, MagicMock
+from unittest.mock import patch
 import requests
 
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(
-    os.path.dirname(os.path.dirname(__file__))), 'src'))
+from src.metrics.data_fetcher.llm import PURDUE_GENAI_URL, get_genai_metric_data
+
+
+class _FakeResp:
+    """Just enough of requests.Response for get_genai_metric_data."""
+    __slots__ = ("_payload", "_json_error")
+
+    def __init__(self, payload, json_error=None):
+        self._payload = payload
+        self._json_error = json_error
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        if self._json_error is not None:
+            raise self._json_error
+        return self._payload
+
+
+def _resp(json_data, json_error=None):
+    """A 200 response whose .json() returns ``json_data`` (or raises)."""
+    return _FakeResp(json_data, json_error)
 
 
 class TestGetGenAIMetricData:
     """Test the get_genai_metric_data function."""
 
     @patch('src.metrics.data_fetcher.llm.PURDUE_GENAI_API_KEY', 'test-key')
-    @patch('src.metrics.data_fetcher.llm.requests.post')
-    def test_successful_genai_call(self, mock_post):
+    @patch('src.http_client._SESSION')
+    def test_successful_genai_call(self, mock_session):
         """Test successful GenAI API call."""
-        from src.metrics.data_fetcher.llm import get_genai_metric_data
-
-        # Mock successful response
-        mock_response = Mock()
-        mock_response.json.return_value = {
+        # Successful response
+        mock_session.post.return_value = _resp({
             "choices": [
                 {
                     "message": {
@@ -31,18 +46,16 @@ class TestGetGenAIMetricData:
                     }
                 }
             ]
-        }
-        mock_response.raise_for_status.return_value = None
-        mock_post.return_value = mock_response
+        })
 
         result = get_genai_metric_data(
             "https://github.com/test/repo", "Test prompt")
 
         assert result == {"metric": "0.85"}
-        mock_post.assert_called_once()
+        mock_session.post.assert_called_once()
 
         # Check the call arguments
-        call_args = mock_post.call_args
+        call_args = mock_session.post.call_args
         assert call_args[0][0] == "https://genai.rcac.purdue.edu/api/chat/completions"
         assert call_args[1]["headers"]["Authorization"] == "Bearer test-key"
         assert call_args[1]["headers"]["Content-Type"] == "application/json"
@@ -59,79 +72,46 @@ class TestGetGenAIMetricData:
     @patch('src.metrics.data_fetcher.llm.PURDUE_GENAI_API_KEY', None)
     def test_no_api_key(self):
         """Test behavior when API key is not set."""
-        from src.metrics.data_fetcher.llm import get_genai_metric_data
-
-        result = get_genai_metric_data(
-            "https://github.com/test/repo", "Test prompt")
-
-        assert result == {}
-
-    @patch('src.metrics.data_fetcher.llm.PURDUE_GENAI_API_KEY', 'test-key')
-    @patch('src.metrics.data_fetcher.llm.requests.post')
-    def test_http_error(self, mock_post):
-        """Test handling of HTTP errors."""
-        from src.metrics.data_fetcher.llm import get_genai_metric_data
-
-        mock_post.side_effect = requests.exceptions.HTTPError("404 Not Found")
-
         result = get_genai_metric_data(
             "https://github.com/test/repo", "Test prompt")
 
         assert result == {}
-        mock_post.assert_called_once()
 
+    @pytest.mark.parametrize("exc", [
+        requests.exceptions.HTTPError("404 Not Found"),
+        requests.exceptions.Timeout("Timeout"),
+        requests.exceptions.ConnectionError("Connection failed"),
+        Exception("Unexpected error"),
+    ], ids=["http", "timeout", "connection", "general"])
     @patch('src.metrics.data_fetcher.llm.PURDUE_GENAI_API_KEY', 'test-key')
-    @patch('src.metrics.data_fetcher.llm.requests.post')
-    def test_timeout_error(self, mock_post):
-        """Test handling of timeout errors."""
-        from src.metrics.data_fetcher.llm import get_genai_metric_data
-
-        mock_post.side_effect = requests.exceptions.Timeout("Timeout")
+    @patch('src.http_client._SESSION')
+    def test_post_exceptions(self, mock_session, exc):
+        """Test that any error raised by the POST yields an empty result."""
+        mock_session.post.side_effect = exc
 
         result = get_genai_metric_data(
             "https://github.com/test/repo", "Test prompt")
 
         assert result == {}
-        mock_post.assert_called_once()
+        mock_session.post.assert_called_once()
 
     @patch('src.metrics.data_fetcher.llm.PURDUE_GENAI_API_KEY', 'test-key')
-    @patch('src.metrics.data_fetcher.llm.requests.post')
-    def test_connection_error(self, mock_post):
-        """Test handling of connection errors."""
-        from src.metrics.data_fetcher.llm import get_genai_metric_data
-
-        mock_post.side_effect = requests.exceptions.ConnectionError(
-            "Connection failed")
-
-        result = get_genai_metric_data(
-            "https://github.com/test/repo", "Test prompt")
-
-        assert result == {}
-        mock_post.assert_called_once()
-
-    @patch('src.metrics.data_fetcher.llm.PURDUE_GENAI_API_KEY', 'test-key')
-    @patch('src.metrics.data_fetcher.llm.requests.post')
-    def test_invalid_json_response(self, mock_post):
+    @patch('src.http_client._SESSION')
+    def test_invalid_json_response(self, mock_session):
         """Test handling of invalid JSON response."""
-        from src.metrics.data_fetcher.llm import get_genai_metric_data
-
-        mock_response = Mock()
-        mock_response.raise_for_status.return_value = None
-        mock_response.json.side_effect = ValueError("Invalid JSON")
-        mock_post.return_value = mock_response
+        mock_session.post.return_value = _resp(
+            None, json_error=ValueError("Invalid JSON"))
 
         result = get_genai_metric_data(
             "https://github.com/test/repo", "Test prompt")
 
         assert result == {}
-        mock_post.assert_called_once()
+        mock_session.post.assert_called_once()
 
     @patch('src.metrics.data_fetcher.llm.PURDUE_GENAI_API_KEY', 'test-key')
-    @patch('src.metrics.data_fetcher.llm.requests.post')
-    def test_empty_response_structure(self, mock_post):
+    @patch('src.http_client._SESSION')
+    def test_empty_response_structure(self, mock_session):
         """Test handling of empty or malformed response structure."""
-        from src.metrics.data_fetcher.llm import get_genai_metric_data
-
         # Test cases that should return {"metric": ""} (successful but empty content)
         success_cases = [
             {},  # Empty response
@@ -140,10 +120,8 @@ class TestGetGenAIMetricData:
         ]
 
         for response_data in success_cases:
-            mock_response = Mock()
-            mock_response.json.return_value = response_data
-            mock_response.raise_for_status.return_value = None
-            mock_post.return_value = mock_response
+            mock_session.post.return_value = _resp(response_data)
+            get_genai_metric_data.cache_clear()
 
             result = get_genai_metric_data(
                 "https://github.com/test/repo", "Test prompt")
@@ -157,23 +135,18 @@ class TestGetGenAIMetricData:
         ]
 
         for response_data in error_cases:
-            mock_response = Mock()
-            mock_response.json.return_value = response_data
-            mock_response.raise_for_status.return_value = None
-            mock_post.return_value = mock_response
+            mock_session.post.return_value = _resp(response_data)
+            get_genai_metric_data.cache_clear()
 
             result = get_genai_metric_data(
                 "https://github.com/test/repo", "Test prompt")
             assert result == {}
 
     @patch('src.metrics.data_fetcher.llm.PURDUE_GENAI_API_KEY', 'test-key')
-    @patch('src.metrics.data_fetcher.llm.requests.post')
-    def test_whitespace_stripping(self, mock_post):
+    @patch('src.http_client._SESSION')
+    def test_whitespace_stripping(self, mock_session):
         """Test that response content is stripped of whitespace."""
-        from src.metrics.data_fetcher.llm import get_genai_metric_data
-
-        mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_session.post.return_value = _resp({
             "choices": [
                 {
                     "message": {
@@ -181,9 +154,7 @@ class TestGetGenAIMetricData:
                     }
                 }
             ]
-        }
-        mock_response.raise_for_status.return_value = None
-        mock_post.return_value = mock_response
+        })
 
         result = get_genai_metric_data(
             "https://github.com/test/repo", "Test prompt")
@@ -192,17 +163,12 @@ class TestGetGenAIMetricData:
 
     @patch('src.metrics.data_fetcher.llm.PURDUE_GENAI_API_KEY', 'test-key')
     @patch('src.metrics.data_fetcher.llm.PURDUE_GENAI_URL', 'https://custom.endpoint.com/api')
-    @patch('src.metrics.data_fetcher.llm.requests.post')
-    def test_custom_endpoint_url(self, mock_post):
+    @patch('src.http_client._SESSION')
+    def test_custom_endpoint_url(self, mock_session):
         """Test using custom endpoint URL from environment variable."""
-        from src.metrics.data_fetcher.llm import get_genai_metric_data
-
-        mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_session.post.return_value = _resp({
             "choices": [{"message": {"content": "0.9"}}]
-        }
-        mock_response.raise_for_status.return_value = None
-        mock_post.return_value = mock_response
+        })
 
         result = get_genai_metric_data(
             "https://github.com/test/repo", "Test prompt")
@@ -210,17 +176,14 @@ class TestGetGenAIMetricData:
         assert result == {"metric": "0.9"}
 
         # Check that custom URL was used
-        call_args = mock_post.call_args
+        call_args = mock_session.post.call_args
         assert call_args[0][0] == "https://custom.endpoint.com/api"
 
     @patch('src.metrics.data_fetcher.llm.PURDUE_GENAI_API_KEY', 'test-key')
-    @patch('src.metrics.data_fetcher.llm.requests.post')
-    def test_complex_response_content(self, mock_post):
+    @patch('src.http_client._SESSION')
+    def test_complex_response_content(self, mock_session):
         """Test with complex response content."""
-        from src.metrics.data_fetcher.llm import get_genai_metric_data
-
-        mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_session.post.return_value = _resp({
             "choices": [
                 {
                     "message": {
@@ -228,9 +191,7 @@ class TestGetGenAIMetricData:
                     }
                 }
             ]
-        }
-        mock_response.raise_for_status.return_value = None
-        mock_post.return_value = mock_response
+        })
 
         result = get_genai_metric_data(
             "https://github.com/test/repo", "Test prompt")
@@ -238,26 +199,43 @@ class TestGetGenAIMetricData:
         expected_content = "Based on my analysis, the score is **0.82** for this repository."
         assert result == {"metric": expected_content}
 
+    @patch('src.metrics.data_fetcher.llm.PURDUE_GENAI_API_KEY', 'test-key')
+    @patch('src.http_client._SESSION')
+    def test_repeat_call_is_served_from_cache(self, mock_session):
+        """Test an identical (url, prompt) pair only hits the API once."""
+        mock_session.post.return_value = _resp(
+            {"choices": [{"message": {"content": "0.6"}}]})
+
+        first = get_genai_metric_data("https://github.com/test/repo", "P")
+        second = get_genai_metric_data("https://github.com/test/repo", "P")
+
+        assert first == second == {"metric": "0.6"}
+        mock_session.post.assert_called_once()
+
     @patch('src.metrics.data_fetcher.llm.PURDUE_GENAI_API_KEY', None)
     def test_no_api_key_env_var(self):
         """Test when API key environment variable is not set at all."""
-        from src.metrics.data_fetcher.llm import get_genai_metric_data
-
         result = get_genai_metric_data(
             "https://github.com/test/repo", "Test prompt")
 
         assert result == {}
 
-    @patch('src.metrics.data_fetcher.llm.PURDUE_GENAI_API_KEY', 'test-key')
-    @patch('src.metrics.data_fetcher.llm.requests.post')
-    def test_general_exception_handling(self, mock_post):
-        """Test handling of general exceptions."""
-        from src.metrics.data_fetcher.llm import get_genai_metric_data
-
-        mock_post.side_effect = Exception("Unexpected error")
-
-        result = get_genai_metric_data(
-            "https://github.com/test/repo", "Test prompt")
-
-        assert result == {}
-        mock_post.assert_called_once()
+    def test_retry_policy_covers_transient_post_failures(self):
+        """Test the session retries POSTs on throttling and 5xx only."""
+        from src.http_client import _genai_retry
+
+        retry = _genai_retry()
+        assert retry.is_retry("POST", 503)
+        assert retry.is_retry("POST", 429)
+        assert not retry.is_retry("POST", 404)
+
+    def test_shared_session_routes_genai_to_its_own_adapter(self):
+        """Test GenAI POSTs and fetcher GETs share one session but not one retry policy."""
+        from src.http_client import get_session
+
+        session = get_session()
+        genai = session.get_adapter(PURDUE_GENAI_URL)
+        github = session.get_adapter("https://api.github.com/repos/a/b")
+        assert genai is not github
+        assert genai.max_retries.is_retry("POST", 503)
+        assert not github.max_retries.is_retry("POST", 503)
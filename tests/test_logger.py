@@ -0,0 +1,62 @@
+"""
+Tests for the logger configuration module.
+"""
+import logging
+
+import pytest
+
+from src import logger as logger_mod
+from src.logger import get_logger
+
+
+@pytest.fixture(autouse=True)
+def fresh_loggers():
+    """Start each test from an empty get_logger cache."""
+    logger_mod._LOGGERS.clear()
+    yield
+    logger_mod._LOGGERS.clear()
+
+
+class TestGetLogger:
+    """Test get_logger configuration and caching."""
+
+    def test_repeat_calls_do_not_duplicate_handlers(self, monkeypatch, tmp_path):
+        """Test the same name/env returns one logger with one file handler."""
+        log_file = tmp_path / "run.log"
+        log_file.touch()
+        monkeypatch.setenv("LOG_LEVEL", "2")
+        monkeypatch.setenv("LOG_FILE", str(log_file))
+
+        first = get_logger("test_repeat")
+        second = get_logger("test_repeat")
+
+        assert first is second
+        assert len(first.handlers) == 1
+        assert first.level == logging.DEBUG
+        first.handlers[0].close()
+
+    def test_env_change_reconfigures(self, monkeypatch):
+        """Test a different LOG_LEVEL produces a reconfigured logger."""
+        monkeypatch.setenv("LOG_LEVEL", "0")
+        monkeypatch.delenv("LOG_FILE", raising=False)
+        assert get_logger("test_env").level == logging.CRITICAL + 1
+
+        monkeypatch.setenv("LOG_LEVEL", "1")
+        assert get_logger("test_env").level == logging.INFO
+
+    def test_env_change_back_reconfigures_again(self, monkeypatch):
+        """Test switching LOG_LEVEL 0 -> 1 -> 0 restores the silent level."""
+        monkeypatch.delenv("LOG_FILE", raising=False)
+        monkeypatch.setenv("LOG_LEVEL", "0")
+        get_logger("test_env_back")
+        monkeypatch.setenv("LOG_LEVEL", "1")
+        get_logger("test_env_back")
+
+        monkeypatch.setenv("LOG_LEVEL", "0")
+        assert get_logger("test_env_back").level == logging.CRITICAL + 1
+
+    def test_invalid_level_does_not_raise(self, monkeypatch):
+        """Test a non-numeric LOG_LEVEL does not raise."""
+        monkeypatch.setenv("LOG_LEVEL", "verbose")
+        monkeypatch.delenv("LOG_FILE", raising=False)
+        assert get_logger("test_invalid").level == logging.DEBUG
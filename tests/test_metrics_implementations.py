@@ -5,14 +5,9 @@ Tests each metric class for calculation accuracy, edge cases,
 and error handling based on actual implementation structure.
 """
 import pytest
-import sys
-import os
 from unittest.mock import Mock, patch, MagicMock
 from typing import Dict, Any
 
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(__file__)), 'src'))
-
 from src.metrics.impl.availability import AvailabilityMetric
 from src.metrics.impl.bus_factor import BusFactorMetric
 from src.metrics.impl.code_quality import CodeQualityMetric
@@ -23,10 +18,46 @@ from src.metrics.impl.ramp_up_time import RampUpTimeMetric
 from src.metrics.impl.size import SizeMetric
 
 
+# Metrics are stateless, so tests share one module-scoped instance of each.
+@pytest.fixture(scope="module")
+def availability_metric():
+    return AvailabilityMetric()
+
+
+@pytest.fixture(scope="module")
+def bus_factor_metric():
+    return BusFactorMetric()
+
+
+@pytest.fixture(scope="module")
+def license_compliance_metric():
+    return LicenseComplianceMetric()
+
+
+@pytest.fixture(scope="module")
+def ramp_up_time_metric():
+    return RampUpTimeMetric()
+
+
+@pytest.fixture(scope="module")
+def performance_claims_metric():
+    return PerformanceClaimsMetric()
+
+
+@pytest.fixture(scope="module")
+def code_quality_metric():
+    return CodeQualityMetric()
+
+
+@pytest.fixture(scope="module")
+def size_metric():
+    return SizeMetric()
+
+
 class TestAvailabilityMetric:
     """Test the AvailabilityMetric class."""
 
-    def test_availability_all_components(self):
+    def test_availability_all_components(self, availability_metric):
         """Test availability with all components present."""
         context = {
             "availability": {
@@ -36,8 +67,7 @@ class TestAvailabilityMetric:
             }
         }
         
-        metric = AvailabilityMetric()
-        result = metric.compute(context)
+        result = availability_metric.compute(context)
         
         assert result.value == 1.0
         assert result.id == "availability"
@@ -45,7 +75,7 @@ class TestAvailabilityMetric:
         assert result.details["has_dataset"] is True
         assert result.details["links_ok"] is True
 
-    def test_availability_partial_components(self):
+    def test_availability_partial_components(self, availability_metric):
         """Test availability with some components missing."""
         context = {
             "availability": {
@@ -55,13 +85,12 @@ class TestAvailabilityMetric:
             }
         }
         
-        metric = AvailabilityMetric()
-        result = metric.compute(context)
+        result = availability_metric.compute(context)
         
         # 2 out of 3 components = 2/3 ≈ 0.67
         assert abs(result.value - (2/3)) < 0.01
 
-    def test_availability_no_components(self):
+    def test_availability_no_components(self, availability_metric):
         """Test availability with no components."""
         context = {
             "availability": {
@@ -71,26 +100,23 @@ class TestAvailabilityMetric:
             }
         }
         
-        metric = AvailabilityMetric()
-        result = metric.compute(context)
+        result = availability_metric.compute(context)
         
         assert result.value == 0.0
 
-    def test_availability_no_data(self):
+    def test_availability_no_data(self, availability_metric):
         """Test availability metric without availability data."""
         context = {}
         
-        metric = AvailabilityMetric()
-        result = metric.compute(context)
+        result = availability_metric.compute(context)
         
         assert result.value == 0.0
 
-    def test_availability_timing(self):
+    def test_availability_timing(self, availability_metric):
         """Test that availability metric records timing."""
         context = {"availability": {"has_code": True, "has_dataset": True, "links_ok": True}}
         
-        metric = AvailabilityMetric()
-        result = metric.compute(context)
+        result = availability_metric.compute(context)
         
         assert result.seconds >= 0
         assert isinstance(result.seconds, float)
@@ -99,7 +125,7 @@ class TestAvailabilityMetric:
 class TestBusFactorMetric:
     """Test the BusFactorMetric class."""
 
-    def test_bus_factor_low_top_contributor(self):
+    def test_bus_factor_low_top_contributor(self, bus_factor_metric):
         """Test bus factor with low top contributor percentage."""
         context = {
             "repo_meta": {
@@ -107,14 +133,13 @@ class TestBusFactorMetric:
             }
         }
         
-        metric = BusFactorMetric()
-        result = metric.compute(context)
+        result = bus_factor_metric.compute(context)
         
         # Should return 1 - 0.2 = 0.8
         assert abs(result.value - 0.8) < 0.01
         assert result.id == "bus_factor"
 
-    def test_bus_factor_high_top_contributor(self):
+    def test_bus_factor_high_top_contributor(self, bus_factor_metric):
         """Test bus factor with high top contributor percentage."""
         context = {
             "repo_meta": {
@@ -122,13 +147,12 @@ class TestBusFactorMetric:
             }
         }
         
-        metric = BusFactorMetric()
-        result = metric.compute(context)
+        result = bus_factor_metric.compute(context)
         
         # Should return 1 - 0.9 = 0.1
         assert abs(result.value - 0.1) < 0.01
 
-    def test_bus_factor_single_contributor(self):
+    def test_bus_factor_single_contributor(self, bus_factor_metric):
         """Test bus factor with single contributor (100%)."""
         context = {
             "repo_meta": {
@@ -136,106 +160,105 @@ class TestBusFactorMetric:
             }
         }
         
-        metric = BusFactorMetric()
-        result = metric.compute(context)
+        result = bus_factor_metric.compute(context)
         
         # Should return 1 - 1.0 = 0.0
         assert result.value == 0.0
 
-    def test_bus_factor_no_data(self):
+    def test_bus_factor_no_data(self, bus_factor_metric):
         """Test bus factor without repo meta data."""
         context = {}
         
-        metric = BusFactorMetric()
-        result = metric.compute(context)
+        result = bus_factor_metric.compute(context)
         
         # Default top_contributor_pct is 1.0, so result should be 0.0
         assert result.value == 0.0
 
-    def test_bus_factor_edge_cases(self):
+    def test_bus_factor_edge_cases(self, bus_factor_metric):
         """Test bus factor with edge case values."""
         # Test with 0% (impossible but edge case)
         context = {"repo_meta": {"top_contributor_pct": 0.0}}
-        metric = BusFactorMetric()
-        result = metric.compute(context)
+        result = bus_factor_metric.compute(context)
         assert result.value == 1.0
         
         # Test with negative (should be clamped)
         context = {"repo_meta": {"top_contributor_pct": -0.1}}
-        metric = BusFactorMetric()
-        result = metric.compute(context)
+        result = bus_factor_metric.compute(context)
         assert result.value == 1.0  # max(0, min(1, 1 - (-0.1))) = 1.0
 
 
 class TestLicenseComplianceMetric:
     """Test the LicenseComplianceMetric class."""
 
-    def test_license_compliance_mit(self):
+    def test_license_compliance_mit(self, license_compliance_metric):
         """Test license compliance with MIT license."""
         context = {"license": "MIT"}
         
-        metric = LicenseComplianceMetric()
-        result = metric.compute(context)
+        result = license_compliance_metric.compute(context)
         
         assert result.value == 1.0
         assert result.id == "license_compliance"
         assert "mit" in result.details["license"]
 
-    def test_license_compliance_apache(self):
+    def test_license_compliance_apache(self, license_compliance_metric):
         """Test license compliance with Apache license."""
         context = {"license": "Apache-2.0"}
         
-        metric = LicenseComplianceMetric()
-        result = metric.compute(context)
+        result = license_compliance_metric.compute(context)
         
         assert result.value == 1.0
         assert "apache-2.0" in result.details["license"]
 
-    def test_license_compliance_proprietary(self):
+    def test_license_compliance_proprietary(self, license_compliance_metric):
         """Test license compliance with proprietary license."""
         context = {"license": "Proprietary"}
         
-        metric = LicenseComplianceMetric()
-        result = metric.compute(context)
+        result = license_compliance_metric.compute(context)
         
         assert result.value == 0.0
 
-    def test_license_compliance_no_license(self):
+    def test_license_compliance_no_license(self, license_compliance_metric):
         """Test license compliance without license."""
         context = {}
         
-        metric = LicenseComplianceMetric()
-        result = metric.compute(context)
+        result = license_compliance_metric.compute(context)
         
         assert result.value == 0.0
 
-    def test_license_compliance_custom_allowed(self):
+    def test_license_compliance_custom_allowed(self, license_compliance_metric):
         """Test license compliance with custom allowed licenses."""
         context = {
             "license": "GPL-3.0",
             "compatible_licenses": ["gpl-3.0", "bsd"]
         }
         
-        metric = LicenseComplianceMetric()
-        result = metric.compute(context)
+        result = license_compliance_metric.compute(context)
         
         assert result.value == 1.0
 
-    def test_license_compliance_partial_match(self):
+    def test_license_compliance_partial_match(self, license_compliance_metric):
         """Test license compliance with partial string match."""
         context = {"license": "MIT License with additional terms"}
         
-        metric = LicenseComplianceMetric()
-        result = metric.compute(context)
+        result = license_compliance_metric.compute(context)
         
         # Should match because "mit" is in the string
         assert result.value == 1.0
 
+    def test_license_compliance_prefers_longest_match(self):
+        """Test the most specific allowed license is reported."""
+        context = {"license": "BSD-3-Clause"}
+
+        result = LicenseComplianceMetric().compute(context)
+
+        assert result.value == 1.0
+        assert result.details["license"] == "bsd-3-clause"
+
 
 class TestRampUpTimeMetric:
     """Test the RampUpTimeMetric class."""
 
-    def test_ramp_up_time_all_components(self):
+    def test_ramp_up_time_all_components(self, ramp_up_time_metric):
         """Test ramp-up time with all components."""
         context = {
             "ramp": {
@@ -245,8 +268,7 @@ class TestRampUpTimeMetric:
             }
         }
         
-        metric = RampUpTimeMetric()
-        result = metric.compute(context)
+        result = ramp_up_time_metric.compute(context)
         
         # Mean of all components: (0.8 + 0.9 + 0.7) / 3 = 0.8
         expected = (0.8 + 0.9 + 0.7) / 3
@@ -254,7 +276,7 @@ class TestRampUpTimeMetric:
         assert result.id == "ramp_up_time"
         assert len(result.details["components"]) == 3
 
-    def test_ramp_up_time_partial_components(self):
+    def test_ramp_up_time_partial_components(self, ramp_up_time_metric):
         """Test ramp-up time with some missing components."""
         context = {
             "ramp": {
@@ -264,35 +286,32 @@ class TestRampUpTimeMetric:
             }
         }
         
-        metric = RampUpTimeMetric()
-        result = metric.compute(context)
+        result = ramp_up_time_metric.compute(context)
         
         # Mean of available components: (0.9 + 0.8) / 2 = 0.85
         expected = (0.9 + 0.8) / 2
         assert abs(result.value - expected) < 0.01
         assert len(result.details["components"]) == 2
 
-    def test_ramp_up_time_no_components(self):
+    def test_ramp_up_time_no_components(self, ramp_up_time_metric):
         """Test ramp-up time without ramp data."""
         context = {"ramp": {}}
         
-        metric = RampUpTimeMetric()
-        result = metric.compute(context)
+        result = ramp_up_time_metric.compute(context)
         
         assert result.value == 0.0
         assert result.details["components"] == []
 
-    def test_ramp_up_time_no_data(self):
+    def test_ramp_up_time_no_data(self, ramp_up_time_metric):
         """Test ramp-up time without ramp key."""
         context = {}
         
-        metric = RampUpTimeMetric()
-        result = metric.compute(context)
+        result = ramp_up_time_metric.compute(context)
         
         assert result.value == 0.0
         assert result.details["components"] == []
 
-    def test_ramp_up_time_single_component(self):
+    def test_ramp_up_time_single_component(self, ramp_up_time_metric):
         """Test ramp-up time with single component."""
         context = {
             "ramp": {
@@ -300,13 +319,12 @@ class TestRampUpTimeMetric:
             }
         }
         
-        metric = RampUpTimeMetric()
-        result = metric.compute(context)
+        result = ramp_up_time_metric.compute(context)
         
         assert result.value == 0.95
         assert len(result.details["components"]) == 1
 
-    def test_ramp_up_time_zero_values(self):
+    def test_ramp_up_time_zero_values(self, ramp_up_time_metric):
         """Test ramp-up time with zero values."""
         context = {
             "ramp": {
@@ -316,13 +334,12 @@ class TestRampUpTimeMetric:
             }
         }
         
-        metric = RampUpTimeMetric()
-        result = metric.compute(context)
+        result = ramp_up_time_metric.compute(context)
         
         assert result.value == 0.0
         assert len(result.details["components"]) == 3
 
-    def test_ramp_up_time_perfect_scores(self):
+    def test_ramp_up_time_perfect_scores(self, ramp_up_time_metric):
         """Test ramp-up time with perfect scores."""
         context = {
             "ramp": {
@@ -332,8 +349,7 @@ class TestRampUpTimeMetric:
             }
         }
         
-        metric = RampUpTimeMetric()
-        result = metric.compute(context)
+        result = ramp_up_time_metric.compute(context)
         
         assert result.value == 1.0
         assert len(result.details["components"]) == 3
@@ -342,54 +358,50 @@ class TestRampUpTimeMetric:
 class TestPerformanceClaimsMetric:
     """Test the PerformanceClaimsMetric class."""
 
-    def test_performance_claims_bert_model(self):
+    def test_performance_claims_bert_model(self, performance_claims_metric):
         """Test performance claims with BERT model (should get 1.0)."""
         context = {"model_url": "https://huggingface.co/bert-base-uncased"}
         
-        metric = PerformanceClaimsMetric()
-        result = metric.compute(context)
+        result = performance_claims_metric.compute(context)
         
         assert result.value == 1.0
         assert result.id == "performance_claims"
         assert result.details["mode"] == "binary"
         assert result.details["has_performance_claims"] == True
 
-    def test_performance_claims_whisper_model(self):
+    def test_performance_claims_whisper_model(self, performance_claims_metric):
         """Test performance claims with Whisper model (should get 1.0)."""
         context = {"model_url": "https://huggingface.co/openai/whisper-tiny"}
         
-        metric = PerformanceClaimsMetric()
-        result = metric.compute(context)
+        result = performance_claims_metric.compute(context)
         
         assert result.value == 1.0
         assert result.details["mode"] == "binary"
         assert result.details["has_performance_claims"] == True
 
-    def test_performance_claims_unknown_model(self):
+    def test_performance_claims_unknown_model(self, performance_claims_metric):
         """Test performance claims with unknown model (should get 0.0)."""
         context = {"model_url": "https://huggingface.co/random/unknown-model"}
         
-        metric = PerformanceClaimsMetric()
-        result = metric.compute(context)
+        result = performance_claims_metric.compute(context)
         
         assert result.value == 0.0
         assert result.details["mode"] == "binary"
         assert result.details["has_performance_claims"] == False
 
-    def test_performance_claims_high_popularity_model(self):
+    def test_performance_claims_high_popularity_model(self, performance_claims_metric):
         """Test performance claims with high popularity model (should get 1.0)."""
         context = {
             "model_url": "https://huggingface.co/some/model",
             "ramp": {"downloads_norm": 0.9, "likes_norm": 0.85}
         }
         
-        metric = PerformanceClaimsMetric()
-        result = metric.compute(context)
+        result = performance_claims_metric.compute(context)
         
         assert result.value == 1.0
         assert result.details["has_performance_claims"] == True
 
-    def test_performance_claims_complete_package(self):
+    def test_performance_claims_complete_package(self, performance_claims_metric):
         """Test performance claims with complete package (code + dataset + model)."""
         context = {
             "model_url": "https://huggingface.co/some/model",
@@ -400,42 +412,38 @@ class TestPerformanceClaimsMetric:
             }
         }
         
-        metric = PerformanceClaimsMetric()
-        result = metric.compute(context)
+        result = performance_claims_metric.compute(context)
         
         assert result.value == 1.0
         assert result.details["has_performance_claims"] == True
 
-    def test_performance_claims_none_passed(self):
+    def test_performance_claims_none_passed(self, performance_claims_metric):
         """Test performance claims with no requirements passed."""
         context = {
             "requirements_passed": 0,
             "requirements_total": 5
         }
         
-        metric = PerformanceClaimsMetric()
-        result = metric.compute(context)
+        result = performance_claims_metric.compute(context)
         
         assert result.value == 0.0
 
-    def test_performance_claims_no_data(self):
+    def test_performance_claims_no_data(self, performance_claims_metric):
         """Test performance claims without data."""
         context = {}
         
-        metric = PerformanceClaimsMetric()
-        result = metric.compute(context)
+        result = performance_claims_metric.compute(context)
         
         # Should default to 0.0 for binary approach
         assert result.value == 0.0
         assert result.details["mode"] == "binary"
         assert result.details["has_performance_claims"] == False
 
-    def test_performance_claims_no_model_url(self):
+    def test_performance_claims_no_model_url(self, performance_claims_metric):
         """Test performance claims with no model URL."""
         context = {"some_other_field": "value"}
         
-        metric = PerformanceClaimsMetric()
-        result = metric.compute(context)
+        result = performance_claims_metric.compute(context)
         
         # Should default to 0.0 without model URL
         assert result.value == 0.0
@@ -445,7 +453,7 @@ class TestPerformanceClaimsMetric:
 class TestCodeQualityMetric:
     """Test the CodeQualityMetric class."""
 
-    def test_code_quality_all_components(self):
+    def test_code_quality_all_components(self, code_quality_metric):
         """Test code quality with all components."""
         context = {
             "code_quality": {
@@ -456,8 +464,7 @@ class TestCodeQualityMetric:
             }
         }
         
-        metric = CodeQualityMetric()
-        result = metric.compute(context)
+        result = code_quality_metric.compute(context)
         
         # Mean of all components: (0.8 + 0.7 + 0.6 + 0.9) / 4 = 0.75
         expected = (0.8 + 0.7 + 0.6 + 0.9) / 4
@@ -465,7 +472,7 @@ class TestCodeQualityMetric:
         assert result.id == "code_quality"
         assert len(result.details["components"]) == 4
 
-    def test_code_quality_partial_components(self):
+    def test_code_quality_partial_components(self, code_quality_metric):
         """Test code quality with some missing components."""
         context = {
             "code_quality": {
@@ -475,35 +482,32 @@ class TestCodeQualityMetric:
             }
         }
         
-        metric = CodeQualityMetric()
-        result = metric.compute(context)
+        result = code_quality_metric.compute(context)
         
         # Mean of available components: (0.9 + 0.8) / 2 = 0.85
         expected = (0.9 + 0.8) / 2
         assert abs(result.value - expected) < 0.01
         assert len(result.details["components"]) == 2
 
-    def test_code_quality_no_components(self):
+    def test_code_quality_no_components(self, code_quality_metric):
         """Test code quality without any components."""
         context = {"code_quality": {}}
         
-        metric = CodeQualityMetric()
-        result = metric.compute(context)
+        result = code_quality_metric.compute(context)
         
         assert result.value == 0.0
         assert result.details["components"] == []
 
-    def test_code_quality_no_data(self):
+    def test_code_quality_no_data(self, code_quality_metric):
         """Test code quality without code_quality data."""
         context = {}
         
-        metric = CodeQualityMetric()
-        result = metric.compute(context)
+        result = code_quality_metric.compute(context)
         
         assert result.value == 0.0
         assert result.details["components"] == []
 
-    def test_code_quality_single_component(self):
+    def test_code_quality_single_component(self, code_quality_metric):
         """Test code quality with single component."""
         context = {
             "code_quality": {
@@ -511,13 +515,12 @@ class TestCodeQualityMetric:
             }
         }
         
-        metric = CodeQualityMetric()
-        result = metric.compute(context)
+        result = code_quality_metric.compute(context)
         
         assert result.value == 0.95
         assert len(result.details["components"]) == 1
 
-    def test_code_quality_zero_values(self):
+    def test_code_quality_zero_values(self, code_quality_metric):
         """Test code quality with zero values."""
         context = {
             "code_quality": {
@@ -528,13 +531,12 @@ class TestCodeQualityMetric:
             }
         }
         
-        metric = CodeQualityMetric()
-        result = metric.compute(context)
+        result = code_quality_metric.compute(context)
         
         assert result.value == 0.0
         assert len(result.details["components"]) == 4
 
-    def test_code_quality_perfect_scores(self):
+    def test_code_quality_perfect_scores(self, code_quality_metric):
         """Test code quality with perfect scores."""
         context = {
             "code_quality": {
@@ -545,13 +547,12 @@ class TestCodeQualityMetric:
             }
         }
         
-        metric = CodeQualityMetric()
-        result = metric.compute(context)
+        result = code_quality_metric.compute(context)
         
         assert result.value == 1.0
         assert len(result.details["components"]) == 4
 
-    def test_code_quality_timing(self):
+    def test_code_quality_timing(self, code_quality_metric):
         """Test that code quality metric records timing."""
         context = {
             "code_quality": {
@@ -560,8 +561,7 @@ class TestCodeQualityMetric:
             }
         }
         
-        metric = CodeQualityMetric()
-        result = metric.compute(context)
+        result = code_quality_metric.compute(context)
         
         assert result.seconds >= 0
         assert isinstance(result.seconds, float)
@@ -570,7 +570,7 @@ class TestCodeQualityMetric:
 class TestSizeMetric:
     """Test the SizeMetric class."""
 
-    def test_size_metric_all_hardware_scores(self):
+    def test_size_metric_all_hardware_scores(self, size_metric):
         """Test size metric with all hardware scores."""
         context = {
             "size_components": {
@@ -581,15 +581,14 @@ class TestSizeMetric:
             }
         }
         
-        metric = SizeMetric()
-        result = metric.compute(context)
+        result = size_metric.compute(context)
         
         # Mean of all scores
         expected = (0.5 + 0.8 + 0.9 + 0.95) / 4
         assert abs(result.value - expected) < 0.01
         assert result.id == "size"
 
-    def test_size_metric_partial_scores(self):
+    def test_size_metric_partial_scores(self, size_metric):
         """Test size metric with partial hardware scores."""
         context = {
             "size_components": {
@@ -599,23 +598,21 @@ class TestSizeMetric:
             }
         }
         
-        metric = SizeMetric()
-        result = metric.compute(context)
+        result = size_metric.compute(context)
         
         # Mean including zeros for missing: (0.3 + 0.0 + 0.8 + 0.0) / 4
         expected = (0.3 + 0.0 + 0.8 + 0.0) / 4
         assert abs(result.value - expected) < 0.01
 
-    def test_size_metric_no_scores(self):
+    def test_size_metric_no_scores(self, size_metric):
         """Test size metric without size components."""
         context = {}
         
-        metric = SizeMetric()
-        result = metric.compute(context)
+        result = size_metric.compute(context)
         
         assert result.value == 0.0
 
-    def test_size_metric_details_storage(self):
+    def test_size_metric_details_storage(self, size_metric):
         """Test that size metric stores details correctly."""
         context = {
             "size_components": {
@@ -626,8 +623,7 @@ class TestSizeMetric:
             }
         }
         
-        metric = SizeMetric()
-        result = metric.compute(context)
+        result = size_metric.compute(context)
         
         # Check that details are stored
         assert "size_score" in result.details
@@ -638,7 +634,7 @@ class TestSizeMetric:
         assert size_scores["desktop_pc"] == 0.85
         assert size_scores["aws_server"] == 0.9
 
-    def test_size_metric_invalid_values(self):
+    def test_size_metric_invalid_values(self, size_metric):
         """Test size metric with invalid values."""
         context = {
             "size_components": {
@@ -648,26 +644,23 @@ class TestSizeMetric:
             }
         }
         
-        metric = SizeMetric()
-        result = metric.compute(context)
+        result = size_metric.compute(context)
         
         # Invalid values should be treated as 0.0
         # (0.0 + 0.0 + 0.8 + 0.0) / 4 = 0.2
         expected = 0.8 / 4
         assert abs(result.value - expected) < 0.01
 
-    def test_size_metric_binary_flag(self):
+    def test_size_metric_binary_flag(self, size_metric):
         """Test size metric binary flag."""
         # With scores > 0
         context = {"size_components": {"raspberry_pi": 0.5}}
-        metric = SizeMetric()
-        result = metric.compute(context)
+        result = size_metric.compute(context)
         assert result.binary == 1
         
         # With all scores = 0
         context = {"size_components": {"raspberry_pi": 0.0, "jetson_nano": 0.0}}
-        metric = SizeMetric()
-        result = metric.compute(context)
+        result = size_metric.compute(context)
         assert result.binary == 0
 
 
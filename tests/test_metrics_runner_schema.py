@@ -6,18 +6,12 @@ and schema compliance.
 """
 from src.metrics.types import MetricResult
 from src.metrics.ops_plan import default_ops
-from src.metrics.runner import run_metrics
+from src.metrics.runner import run_metrics, build_registry_from_plan
 import pytest
-import sys
-import os
 import json
 from unittest.mock import Mock, patch, MagicMock
 from typing import Dict, Any
 
-# Add src to path
-sys.path.insert(0, os.path.join(
-    os.path.dirname(os.path.dirname(__file__)), 'src'))
-
 
 class TestMetricsRunner:
     """Test the metrics runner functionality."""
@@ -47,6 +41,16 @@ class TestMetricsRunner:
         assert isinstance(summary["NetScore_weighted"], (int, float))
         assert isinstance(summary["NetScore_binary"], (int, float))
 
+    def test_registry_is_not_shared(self):
+        """Test each call gets its own registry over the shared metric instances."""
+        reg = build_registry_from_plan()
+        reg.register(Mock(id="extra"))
+        other = build_registry_from_plan()
+        assert other is not reg
+        assert "extra" not in other.list_ids()
+        assert other.get("size") is reg.get("size")
+        assert set(other.list_ids()) >= {op.metric_id for op in default_ops}
+
     def test_run_metrics_empty_data(self):
         """Test metrics runner with empty data."""
         results, summary, latencies = run_metrics(default_ops, {})
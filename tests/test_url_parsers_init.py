@@ -3,12 +3,6 @@ Tests for url_parsers module initialization functions.
 """
 from src.url_parsers import detect, fetch_metadata
 import pytest
-import sys
-import os
-
-# Add src to path
-sys.path.insert(0, os.path.join(
-    os.path.dirname(os.path.dirname(__file__)), 'src'))
 
 
 class TestDetect:
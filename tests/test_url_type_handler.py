@@ -6,18 +6,17 @@ and NDJSON output generation.
 """
 from src.url_parsers.url_type_handler import (
     _valid_code_url, _valid_dataset_url, _valid_model_url, _genai_single_url,
-    get_code_url_from_genai, get_dataset_url_from_genai, get_url_category, handle_url,
+    get_code_url_from_genai, get_dataset_url_from_genai, get_urls_from_genai, get_url_category, handle_url,
+    _handle_row_cached, _log_cache_stats, _metric_cache_path, UrlCtx,
     HF_MODEL_PATTERN, HF_DATASET_PATTERN, GITHUB_CODE_PATTERN, GITLAB_CODE_PATTERN, HF_SPACES_PATTERN
 )
 import pytest
-import sys
+import json
 import os
 from unittest.mock import Mock, patch, MagicMock
 from typing import Dict, List, Optional
 
-# Add src to path
-sys.path.insert(0, os.path.join(
-    os.path.dirname(os.path.dirname(__file__)), 'src'))
+from _fixtures import MetricStub, SizeMetricStub, TimingOnlyStub
 
 
 class TestURLValidation:
@@ -80,11 +79,9 @@ class TestURLValidation:
 
     def test_valid_model_url_invalid(self):
         """Test invalid model URLs."""
-        # Dataset URLs should still match the broad HF pattern but not be valid model URLs
-        # However, the current implementation doesn't distinguish, so this actually returns True
-        # Current implementation is broad
+        # Dataset URLs share the HF host but are not model URLs
         assert _valid_model_url(
-            "https://huggingface.co/datasets/squad") is True
+            "https://huggingface.co/datasets/squad") is False
         assert _valid_model_url("https://github.com/owner/repo") is False
         assert _valid_model_url(None) is False
         assert _valid_model_url("") is False
@@ -101,9 +98,11 @@ class TestRegexPatterns:
             "https://huggingface.co/owner/model") is not None
         assert HF_MODEL_PATTERN.match(
             "https://huggingface.co/owner/model/tree/main") is not None
-        # Current pattern is broad and matches dataset URLs too
+        # Dataset and Space URLs live on the same host but are not models
         assert HF_MODEL_PATTERN.match(
-            "https://huggingface.co/datasets/squad") is not None
+            "https://huggingface.co/datasets/squad") is None
+        assert HF_MODEL_PATTERN.match(
+            "https://huggingface.co/spaces/owner/space") is None
 
     def test_hf_dataset_pattern(self):
         """Test HuggingFace dataset pattern matching."""
@@ -145,60 +144,49 @@ class TestRegexPatterns:
 class TestGenAIIntegration:
     """Test GenAI studio integration."""
 
-    @pytest.mark.skip(reason="Persistent mock issue - skipping for now")
-    def test_genai_single_url_no_api_key(self):
+    @patch('src.url_parsers.url_type_handler.PURDUE_GENAI_API_KEY', None)
+    @patch('src.http_client._SESSION')
+    def test_genai_single_url_no_api_key(self, mock_session):
         """Test GenAI call without API key."""
-        # Import the actual function and test it
-        from src.url_parsers.url_type_handler import _genai_single_url as actual_genai
-
-        # Clear env and test the actual function directly
-        import os
-        original_key = os.environ.get("GEN_AI_STUDIO_API_KEY")
-        if "GEN_AI_STUDIO_API_KEY" in os.environ:
-            del os.environ["GEN_AI_STUDIO_API_KEY"]
-
-        try:
-            # Call actual function with clear env
-            result = actual_genai("test prompt")
-            # In case there's some weird persistent mock, just check if it's None or the expected None
-            assert result is None or result == "None"
-        finally:
-            if original_key:
-                os.environ["GEN_AI_STUDIO_API_KEY"] = original_key
+        # The key is read once at import, so patch the module constant
+        result = _genai_single_url("test prompt")
+
+        assert result is None
+        mock_session.post.assert_not_called()
 
     @patch('src.url_parsers.url_type_handler.PURDUE_GENAI_API_KEY', 'test_key')
-    @patch('requests.post')
-    def test_genai_single_url_success(self, mock_post):
+    @patch('src.http_client._SESSION')
+    def test_genai_single_url_success(self, mock_session):
         """Test successful GenAI call."""
         mock_response = Mock()
         mock_response.raise_for_status.return_value = None
         mock_response.json.return_value = {
             "choices": [{"message": {"content": "https://example.com/result"}}]
         }
-        mock_post.return_value = mock_response
+        mock_session.post.return_value = mock_response
 
         result = _genai_single_url("test prompt")
         assert result == "https://example.com/result"
 
     @patch('src.url_parsers.url_type_handler.PURDUE_GENAI_API_KEY', 'test_key')
-    @patch('requests.post')
-    def test_genai_single_url_no_url_in_response(self, mock_post):
+    @patch('src.http_client._SESSION')
+    def test_genai_single_url_no_url_in_response(self, mock_session):
         """Test GenAI call with no URL in response."""
         mock_response = Mock()
         mock_response.raise_for_status.return_value = None
         mock_response.json.return_value = {
             "choices": [{"message": {"content": "No URL here"}}]
         }
-        mock_post.return_value = mock_response
+        mock_session.post.return_value = mock_response
 
         result = _genai_single_url("test prompt")
         assert result is None
 
     @patch('src.url_parsers.url_type_handler.PURDUE_GENAI_API_KEY', 'test_key')
-    @patch('requests.post')
-    def test_genai_single_url_api_error(self, mock_post):
+    @patch('src.http_client._SESSION')
+    def test_genai_single_url_api_error(self, mock_session):
         """Test GenAI call with API error."""
-        mock_post.side_effect = Exception("API error")
+        mock_session.post.side_effect = Exception("API error")
 
         result = _genai_single_url("test prompt")
         assert result is None
@@ -229,6 +217,27 @@ class TestGenAIIntegration:
             result = get_dataset_url_from_genai("https://huggingface.co/model")
             assert result == "https://huggingface.co/datasets/squad"
 
+    @patch('src.url_parsers.url_type_handler._genai_chat')
+    def test_get_urls_from_genai_success(self, mock_chat):
+        """Test getting code and dataset URLs from one GenAI reply."""
+        mock_chat.return_value = (
+            'Here you go: {"code_url": "https://github.com/owner/repo", '
+            '"dataset_url": "https://huggingface.co/datasets/owner/squad"}')
+
+        code_url, dataset_url = get_urls_from_genai("https://huggingface.co/model")
+        assert code_url == "https://github.com/owner/repo"
+        assert dataset_url == "https://huggingface.co/datasets/owner/squad"
+        mock_chat.assert_called_once()
+
+    @patch('src.url_parsers.url_type_handler._genai_chat')
+    def test_get_urls_from_genai_invalid_reply(self, mock_chat):
+        """Test GenAI replies that are not JSON or contain invalid URLs."""
+        mock_chat.return_value = "I don't know"
+        assert get_urls_from_genai("https://huggingface.co/model") == (None, None)
+
+        mock_chat.return_value = '{"code_url": "https://example.com/x", "dataset_url": null}'
+        assert get_urls_from_genai("https://huggingface.co/model") == (None, None)
+
 
 class TestURLCategoryClassification:
     """Test URL category classification."""
@@ -257,6 +266,18 @@ class TestURLCategoryClassification:
         assert categories["test1"] == "MODEL"
         assert categories["test2"] is None
 
+    @patch('src.url_parsers.url_type_handler._fill_missing_links')
+    def test_get_url_category_blank_model_url(self, mock_fill):
+        """Test padded model URLs are MODEL and whitespace-only ones are not."""
+        models = {
+            "a": [None, None, "https://huggingface.co/owner/model"],
+            "b": [None, None, " https://huggingface.co/owner/model\n"],
+            "c": [None, None, "   "],
+        }
+
+        categories = get_url_category(models)
+        assert categories == {"a": "MODEL", "b": "MODEL", "c": None}
+
     def test_get_url_category_normalize_links(self):
         """Test that get_url_category normalizes link arrays."""
         models = {
@@ -274,12 +295,11 @@ class TestURLCategoryClassification:
         assert models["test2"][2] is None  # Third element should be None
         assert models["test3"][2] is None  # Third element should be None
 
-    @patch('src.url_parsers.url_type_handler.get_code_url_from_genai')
-    @patch('src.url_parsers.url_type_handler.get_dataset_url_from_genai')
-    def test_get_url_category_genai_enrichment(self, mock_dataset_genai, mock_code_genai):
+    @patch('src.url_parsers.url_type_handler.get_urls_from_genai')
+    def test_get_url_category_genai_enrichment(self, mock_urls_genai):
         """Test GenAI enrichment of missing links."""
-        mock_code_genai.return_value = "https://github.com/owner/repo"
-        mock_dataset_genai.return_value = "https://huggingface.co/datasets/squad"
+        mock_urls_genai.return_value = (
+            "https://github.com/owner/repo", "https://huggingface.co/datasets/squad")
 
         models = {
             "test": [None, None, "https://huggingface.co/model"]
@@ -291,16 +311,15 @@ class TestURLCategoryClassification:
         assert models["test"][0] == "https://github.com/owner/repo"
         assert models["test"][1] == "https://huggingface.co/datasets/squad"
 
-        mock_code_genai.assert_called_once_with("https://huggingface.co/model")
-        mock_dataset_genai.assert_called_once_with(
-            "https://huggingface.co/model")
+        # Both links come from a single GenAI request
+        mock_urls_genai.assert_called_once_with("https://huggingface.co/model")
 
 
 class TestHandleURL:
     """Test the main handle_url function."""
 
-    @patch('src.url_parsers.url_type_handler.fetch_comprehensive_metrics_data')
-    @patch('src.url_parsers.url_type_handler.run_metrics')
+    @patch('src.metrics.data_fetcher.fetch_comprehensive_metrics_data')
+    @patch('src.metrics.runner.run_metrics')
     @patch('src.url_parsers.url_type_handler.get_url_category')
     def test_handle_url_success(self, mock_category, mock_run_metrics, mock_fetch_data):
         """Test successful URL handling."""
@@ -316,24 +335,20 @@ class TestHandleURL:
         }
 
         # Mock metric results
-        mock_size_metric = Mock()
-        mock_size_metric.details = {"size_score": {
-            "raspberry_pi": 0.5, "jetson_nano": 0.8, "desktop_pc": 0.9, "aws_server": 0.95}}
-        mock_size_metric.seconds = 0.001
-
-        mock_perf_metric = Mock()
-        mock_perf_metric.value = 0.75
-        mock_perf_metric.seconds = 0.002
+        mock_size_metric = SizeMetricStub(details={"size_score": {
+            "raspberry_pi": 0.5, "jetson_nano": 0.8, "desktop_pc": 0.9, "aws_server": 0.95}},
+            seconds=0.001)
+        mock_perf_metric = MetricStub(0.75, 0.002)
 
         mock_results = {
             "size": mock_size_metric,
             "performance_claims": mock_perf_metric,
-            "ramp_up_time": Mock(value=0.8, seconds=0.001),
-            "bus_factor": Mock(value=0.6, seconds=0.001),
-            "license_compliance": Mock(value=1.0, seconds=0.001),
-            "availability": Mock(value=1.0, seconds=0.001),
-            "dataset_quality": Mock(value=0.7, seconds=0.001),
-            "code_quality": Mock(value=0.8, seconds=0.001)
+            "ramp_up_time": MetricStub(0.8, 0.001),
+            "bus_factor": MetricStub(0.6, 0.001),
+            "license_compliance": MetricStub(1.0, 0.001),
+            "availability": MetricStub(1.0, 0.001),
+            "dataset_quality": MetricStub(0.7, 0.001),
+            "code_quality": MetricStub(0.8, 0.001)
         }
 
         mock_summary = {"net_score": 0.75, "net_score_latency": 10}
@@ -358,8 +373,8 @@ class TestHandleURL:
         assert ndjson["size_score"]["desktop_pc"] == 0.9
         assert ndjson["size_score"]["aws_server"] == 0.95
 
-    @patch('src.url_parsers.url_type_handler.fetch_comprehensive_metrics_data')
-    @patch('src.url_parsers.url_type_handler.run_metrics')
+    @patch('src.metrics.data_fetcher.fetch_comprehensive_metrics_data')
+    @patch('src.metrics.runner.run_metrics')
     @patch('src.url_parsers.url_type_handler.get_url_category')
     def test_handle_url_missing_metrics(self, mock_category, mock_run_metrics, mock_fetch_data):
         """Test URL handling with missing metrics."""
@@ -387,18 +402,36 @@ class TestHandleURL:
         # Recalculated based on default values
         assert abs(ndjson["net_score"] - 0.75) < 1e-10
 
-    @patch('src.url_parsers.url_type_handler.fetch_comprehensive_metrics_data')
-    @patch('src.url_parsers.url_type_handler.run_metrics')
+    @pytest.mark.parametrize("details", [
+        ["not", "a", "dict"],
+        {"size_score": 0.5},
+        {"size_score": ["raspberry_pi"]},
+    ])
+    @patch('src.metrics.data_fetcher.fetch_comprehensive_metrics_data')
+    @patch('src.metrics.runner.run_metrics')
+    @patch('src.url_parsers.url_type_handler.get_url_category')
+    def test_handle_url_non_dict_size_details(self, mock_category, mock_run_metrics, mock_fetch_data, details):
+        """Non-dict size details or scores fall back to the defaults."""
+        mock_category.return_value = {"test": "MODEL"}
+        mock_fetch_data.return_value = {}
+        mock_run_metrics.return_value = (
+            {"size": SizeMetricStub(details=details, seconds=0.001)},
+            {"net_score": 0.0, "net_score_latency": 0}, {})
+
+        result = handle_url({"test": [None, None, "https://huggingface.co/model"]})
+
+        assert result["test"]["size_score"]["raspberry_pi"] == 0.75
+
+    @patch('src.metrics.data_fetcher.fetch_comprehensive_metrics_data')
+    @patch('src.metrics.runner.run_metrics')
     @patch('src.url_parsers.url_type_handler.get_url_category')
     def test_handle_url_size_metric_without_details(self, mock_category, mock_run_metrics, mock_fetch_data):
         """Test URL handling when size metric lacks details."""
         mock_category.return_value = {"test": "MODEL"}
         mock_fetch_data.return_value = {}
 
-        # Mock size metric without details attribute
-        mock_size_metric = Mock()
-        del mock_size_metric.details  # Remove details attribute
-        mock_size_metric.seconds = 0.5  # Set seconds as a number, not Mock
+        # Size metric without a details attribute
+        mock_size_metric = TimingOnlyStub(seconds=0.5)
 
         mock_results = {"size": mock_size_metric}
         mock_summary = {"net_score": 0.5}
@@ -417,8 +450,8 @@ class TestHandleURL:
         # Default value - all components in size_score object
         assert ndjson["size_score"]["jetson_nano"] == 0.75
 
-    @patch('src.url_parsers.url_type_handler.fetch_comprehensive_metrics_data')
-    @patch('src.url_parsers.url_type_handler.run_metrics')
+    @patch('src.metrics.data_fetcher.fetch_comprehensive_metrics_data')
+    @patch('src.metrics.runner.run_metrics')
     @patch('src.url_parsers.url_type_handler.get_url_category')
     def test_handle_url_multiple_models(self, mock_category, mock_run_metrics, mock_fetch_data):
         """Test handling multiple models."""
@@ -443,14 +476,114 @@ class TestHandleURL:
         assert result["model1"]["category"] == "MODEL"
         assert result["model2"]["category"] is None
 
+    @patch('src.metrics.data_fetcher.fetch_comprehensive_metrics_data')
+    @patch('src.metrics.runner.run_metrics')
+    def test_handle_url_empty_row_skips_metrics(self, mock_run_metrics, mock_fetch_data):
+        """Rows without any URL bypass fetching and metric computation."""
+        result = handle_url({"blank": ["", " ", None]})
+
+        mock_fetch_data.assert_not_called()
+        mock_run_metrics.assert_not_called()
+        assert result["blank"]["category"] is None
+        assert result["blank"]["ramp_up_time"] == 0.75
+
+    @patch.dict(os.environ, {"METRIC_CACHE": "1"})
+    @patch('src.metrics.data_fetcher.fetch_comprehensive_metrics_data')
+    @patch('src.metrics.runner.run_metrics')
+    @patch('src.url_parsers.url_type_handler.get_url_category')
+    def test_handle_url_metric_cache(self, mock_category, mock_run_metrics, mock_fetch_data, tmp_path):
+        """Repeated rows are served from the in-memory and on-disk cache."""
+        mock_category.return_value = {"test": "MODEL"}
+        mock_fetch_data.return_value = {}
+        mock_run_metrics.return_value = ({}, {"net_score": 0.5}, {})
+
+        models = {"test": [None, None, "https://huggingface.co/owner/cached"]}
+        with patch('src.url_parsers.url_type_handler.METRIC_CACHE_DIR', str(tmp_path)):
+            _handle_row_cached.cache_clear()
+            first = handle_url(models)
+            second = handle_url(models)
+            assert mock_run_metrics.call_count == 1
+            assert len(list(tmp_path.glob("*.json"))) == 1
+
+            # A fresh process (empty memory cache) still hits the disk cache
+            _handle_row_cached.cache_clear()
+            third = handle_url(models)
+            _handle_row_cached.cache_clear()
+
+        assert mock_run_metrics.call_count == 1
+        assert first == second == third
+        assert first["test"]["name"] == "cached"
+
+    @patch.dict(os.environ, {"METRIC_CACHE": "1"})
+    @patch('src.metrics.data_fetcher.fetch_comprehensive_metrics_data')
+    @patch('src.metrics.runner.run_metrics')
+    @patch('src.url_parsers.url_type_handler.get_url_category')
+    def test_handle_url_metric_cache_expires(self, mock_category, mock_run_metrics, mock_fetch_data, tmp_path):
+        """Disk cache entries older than METRIC_CACHE_TTL are recomputed."""
+        mock_category.return_value = {"test": "MODEL"}
+        mock_fetch_data.return_value = {}
+        mock_run_metrics.return_value = ({}, {"net_score": 0.5}, {})
+
+        models = {"test": [None, None, "https://huggingface.co/owner/stale"]}
+        with patch('src.url_parsers.url_type_handler.METRIC_CACHE_DIR', str(tmp_path)):
+            _handle_row_cached.cache_clear()
+            handle_url(models)
+            (entry,) = tmp_path.glob("*.json")
+            os.utime(entry, (0, 0))
+
+            _handle_row_cached.cache_clear()
+            handle_url(models)
+            _handle_row_cached.cache_clear()
+
+        assert mock_run_metrics.call_count == 2
+
+    @patch.dict(os.environ, {"METRIC_CACHE": "1"})
+    @patch('src.metrics.data_fetcher.fetch_comprehensive_metrics_data')
+    @patch('src.metrics.runner.run_metrics')
+    @patch('src.url_parsers.url_type_handler.get_url_category')
+    def test_handle_url_metric_cache_truncated_entry(self, mock_category, mock_run_metrics, mock_fetch_data, tmp_path):
+        """A truncated disk cache entry is recomputed and rewritten."""
+        mock_category.return_value = {"test": "MODEL"}
+        mock_fetch_data.return_value = {}
+        mock_run_metrics.return_value = ({}, {"net_score": 0.5}, {})
+
+        models = {"test": [None, None, "https://huggingface.co/owner/broken"]}
+        with patch('src.url_parsers.url_type_handler.METRIC_CACHE_DIR', str(tmp_path)):
+            path = _metric_cache_path(UrlCtx(None, None, models["test"][2]), "MODEL")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write('{"name": "bro')
+
+            _handle_row_cached.cache_clear()
+            result = handle_url(models)
+            _handle_row_cached.cache_clear()
+
+            with open(path, encoding="utf-8") as f:
+                assert json.loads(f.read()) == result["test"]
+            assert [p.name for p in tmp_path.iterdir()] == [os.path.basename(path)]
+
+        assert mock_run_metrics.call_count == 1
+        assert result["test"]["name"] == "broken"
+        assert result["test"]["category"] == "MODEL"
+
+    def test_log_cache_stats_warns_on_churn(self, caplog):
+        """A full cache with mostly misses is reported at exit."""
+        from functools import _CacheInfo
+        churn = Mock()
+        churn.cache_info.return_value = _CacheInfo(hits=1, misses=9, maxsize=4, currsize=4)
+        with patch('src.url_parsers.url_type_handler._handle_row_cached', churn):
+            with caplog.at_level("INFO", logger="src.url_parsers.url_type_handler"):
+                _log_cache_stats()
+        assert "metric row cache" in caplog.text
+        assert "consider raising maxsize" in caplog.text
+
 
 class TestIntegration:
     """Integration tests for the URL type handler."""
 
     def test_handle_url_integration_minimal(self):
         """Integration test with minimal real data (no external API calls)."""
-        with patch('src.url_parsers.url_type_handler.fetch_comprehensive_metrics_data') as mock_fetch:
-            with patch('src.url_parsers.url_type_handler.run_metrics') as mock_run:
+        with patch('src.metrics.data_fetcher.fetch_comprehensive_metrics_data') as mock_fetch:
+            with patch('src.metrics.runner.run_metrics') as mock_run:
                 # Mock minimal data
                 mock_fetch.return_value = {
                     "availability": {"links_ok": False},